@@ -1,11 +1,40 @@
+import asyncio
+import copy
 import json
 import logging
+import os
+import stat
+import tempfile
+import threading
 from os.path import exists
 from typing import Dict, Tuple, Any, Type
 
 from accounting_bot.exceptions import ConfigException
 
 logger = logging.getLogger("bot.config")
+# Saves may run concurrently inside worker threads, they are written one after another
+_write_lock = threading.Lock()
+
+
+def _write_config(raw: Dict[str, Any], path: str):
+    # The config is written into a temporary file first and then replaces the old one, so a crash while saving
+    # can't leave behind a partially written config
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf8") as outfile:
+            json.dump(raw, outfile, indent=4, ensure_ascii=False)
+        if exists(path):
+            # mkstemp creates the file only readable for the owner, the permissions of the old config are kept
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    logger.info("Config %s saved", path)
 
 
 class ConfigElement:
@@ -22,6 +51,8 @@ class ConfigElement:
 class Config:
     def __init__(self):
         self._tree = {}
+        self._saved = None  # type: Tuple[str, int, Dict[str, Any] | None] | None
+        self._save_counter = 0
 
     def create_sub_config(self, path: str) -> "Config":
         """
@@ -143,21 +174,63 @@ class Config:
         """
         if exists(path):
             with open(path, encoding="utf8") as json_file:
-                raw_conf = json.load(json_file)
-                self._from_dict(raw_conf)
+                self.load_json(json_file.read())
         else:
             logger.warning("Config %s does not exists!", path)
 
+    def load_json(self, raw_json: str):
+        """
+        Loads the config from a JSON string, see :meth:`load_config`.
+
+        :param raw_json: The content of a config file
+        """
+        self._from_dict(json.loads(raw_json))
+        with _write_lock:
+            if self._saved is not None:
+                # The loaded content may differ from the last saved state, the next save has to write the file. The
+                # version is kept, so older snapshots that are still pending get skipped.
+                self._saved = (self._saved[0], self._saved[1], None)
+
     def save_config(self, path: str):
         """
-        Saves the config to the file system.
+        Saves the config to the file system. The file is only written if the config changed since it was last saved.
 
         :param path: The path of the file
         """
-        raw = self._to_dict()
-        with open(path, "w", encoding="utf8") as outfile:
-            json.dump(raw, outfile, indent=4, ensure_ascii=False)
-        logger.info("Config %s saved", path)
+        self._save_counter += 1
+        self._save_snapshot(copy.deepcopy(self._to_dict()), path, self._save_counter)
+
+    async def save_config_async(self, path: str):
+        """
+        Saves the config to the file system without blocking the event loop. A copy of the config gets created inside
+        the current thread, only the file io is done inside a separate thread.
+
+        :param path: The path of the file
+        """
+        self._save_counter += 1
+        await asyncio.to_thread(self._save_snapshot, copy.deepcopy(self._to_dict()), path, self._save_counter)
+
+    def _save_snapshot(self, raw: Dict[str, Any], path: str, version: int):
+        """
+        Writes a snapshot of the config. A snapshot is skipped if a newer snapshot was already written, e.g. because an
+        older save was delayed inside its worker thread. It is also skipped if it equals the last written snapshot, as
+        long as the file exists and the config wasn't loaded again since then.
+
+        :param raw: The snapshot of the config
+        :param path: The path of the file
+        :param version: The version of the snapshot, newer snapshots must have a higher version
+        """
+        with _write_lock:
+            if self._saved is not None and self._saved[0] == path:
+                if self._saved[1] > version:
+                    logger.debug("Config %s was already saved with a newer state, skipping save", path)
+                    return
+                if self._saved[2] == raw and exists(path):
+                    logger.debug("Config %s is unchanged, skipping save", path)
+                    self._saved = (path, version, raw)
+                    return
+            _write_config(raw, path)
+            self._saved = (path, version, raw)
 
     def __getitem__(self, key: str):
         split = key.split(".", 1)
@@ -1,16 +1,50 @@
-from logging import Handler, LogRecord
-from typing import Union
+import asyncio
+import logging
+import time
+from logging import Handler, LogRecord, Formatter
+from typing import Union, List, Tuple
 
 from discord import Thread
 from discord.abc import GuildChannel, PrivateChannel
 
+logger = logging.getLogger("bot.logger")
+
+
+class CachedTimeFormatter(Formatter):
+    """
+    Formatter that caches the formatted timestamp (without milliseconds), strftime will only be called once per second.
+    A custom datefmt is not supported by the cache and will be passed to the default implementation.
+    """
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Stored as tuple, so it can be replaced atomically when the formatter is shared between threads
+        self._cached_time = (None, "")  # type: tuple[int | None, str]
+
+    def formatTime(self, record: LogRecord, datefmt: str | None = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, formatted = self._cached_time
+        if cached_second != second:
+            formatted = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached_time = (second, formatted)
+        return self.default_msec_format % (formatted, record.msecs)
+
 
 class PycordHandler(Handler):
     """
     Logging handler to send the logs into a discord channel. The logs are cached by the handler, by calling process_logs
     the cache will be sent into the channel.
 
+    After calling start, a background task waits for new records and sends them with a short delay, so bursts of logs
+    get combined into one message. Records may be emitted from any thread.
     """
+    #: Time in seconds to wait after the first new record before sending the logs
+    BATCH_DELAY = 2
+    #: Time in seconds to wait before sending the logs again after an error
+    ERROR_DELAY = 60
+    MAX_ERROR_DELAY = 600
+
     def __init__(self,
                  channel: Union[GuildChannel, PrivateChannel, Thread] = None,
                  level: Union[int, str] = "FATAL"
@@ -18,13 +52,67 @@ class PycordHandler(Handler):
         super().__init__(level)
         self.channel = channel
         self.cache = []
+        self._loop = None  # type: asyncio.AbstractEventLoop | None
+        self._new_logs = None  # type: asyncio.Event | None
+        self._task = None  # type: asyncio.Task | None
 
     def emit(self, record: LogRecord) -> None:
+        if record.name == logger.name:
+            # Errors of this handler (e.g. failed sends) would be sent into the channel again, they are only
+            # written into the other log outputs
+            return
         self.cache.append(record)
+        if self._new_logs is None or self._new_logs.is_set():
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._new_logs.set)
+        except RuntimeError:
+            # The event loop is already closed
+            pass
 
     def set_channel(self, channel: Union[GuildChannel, PrivateChannel, Thread]):
         self.channel = channel
 
+    def start(self):
+        """
+        Starts the background task that sends the logs, has to be called from inside the event loop. Does nothing if
+        the task is already running.
+        """
+        if self._task is not None and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._new_logs = asyncio.Event()
+        if len(self.cache) > 0:
+            self._new_logs.set()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Stops the background task and sends out the remaining logs.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._new_logs = None
+        await self.process_logs()
+
+    async def _run(self):
+        error_delay = self.ERROR_DELAY
+        while True:
+            await self._new_logs.wait()
+            await asyncio.sleep(self.BATCH_DELAY)
+            self._new_logs.clear()
+            try:
+                await self.process_logs()
+                error_delay = self.ERROR_DELAY
+            except Exception as e:
+                logger.error("Failed to send logs, retrying in %s seconds: %s", error_delay, e)
+                await asyncio.sleep(error_delay)
+                error_delay = min(error_delay * 2, self.MAX_ERROR_DELAY)
+                # The unsent logs are back in the cache, retrying even if no new records were emitted
+                if len(self.cache) > 0:
+                    self._new_logs.set()
+
     async def process_logs(self):
         """
         Processes the log cache and send out all cached logs into the channel.
@@ -41,25 +129,34 @@ class PycordHandler(Handler):
         if len(self.cache) > 100:
             self.cache.clear()
             return
-        msg = "```"
-        while len(self.cache) > 0:
-            record = self.cache.pop(0)
-            text = self.format(record)
-            text = text.replace("\\", "/")
+        records, self.cache = self.cache, []
+        # List of chunks, containing the text lines and the index of the first record of the chunk
+        chunks = []  # type: List[Tuple[List[str], int]]
+        lines = []
+        start = 0
+        length = 0
+        for i, record in enumerate(records):
+            text = self.format(record).replace("\\", "/")
             if len(text.strip()) == 0:
                 continue
-            if len(msg) + len(text) < 1970:
-                # Message length is fine
-                msg += "\n" + text
-            else:
+            if len(text) > 1970:
+                # Truncating text
+                text = text[:1970] + " **(Truncated)**"
+            if len(lines) > 0 and length + len(text) >= 1970:
                 # Message would become to long
-                msg += "\n```"
-                if len(msg) > 7:
-                    await self.channel.send(content=msg)
-                if len(text) > 1970:
-                    # Truncating text
-                    text = text[:1970] + " **(Truncated)**"
-                msg = "```\n" + text
-        if len(msg) > 3:
-            msg += "\n```"
-            await self.channel.send(content=msg)
+                chunks.append((lines, start))
+                lines = []
+                start = i
+                length = 0
+            lines.append(text)
+            length += len(text) + 1
+        if len(lines) > 0:
+            chunks.append((lines, start))
+        # The messages are sent one after another to keep the order of the logs
+        for lines, start in chunks:
+            try:
+                await self.channel.send(content="```\n" + "\n".join(lines) + "\n```")
+            except Exception:
+                # Keeping the unsent logs for the next try
+                self.cache[:0] = records[start:]
+                raise
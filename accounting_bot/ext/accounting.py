@@ -9,15 +9,16 @@ import logging
 import time
 from abc import ABC, abstractmethod
 from asyncio import Lock
-from datetime import datetime
-from typing import Optional, Callable, TypeVar, Tuple, Dict
-from typing import Union, List
+from datetime import datetime, tzinfo
+from typing import Optional, Callable, TypeVar, Tuple, Dict, Awaitable
+from typing import Union, List, FrozenSet
+from zoneinfo import ZoneInfo
 
 import discord
 import discord.ext
 import mariadb
-import pytz
-from discord import Embed, Interaction, Color, Message, ApplicationContext, option, User, RawReactionActionEvent
+from discord import Embed, Interaction, Color, Message, ApplicationContext, option, User, RawReactionActionEvent, \
+    TextChannel, Member
 from discord.ext import commands
 from discord.ext.commands import Cog, CheckFailure
 from discord.ui import Modal, InputText
@@ -40,6 +41,8 @@ _T = TypeVar("_T")
 logger = logging.getLogger("ext.accounting")
 
 NAME_SHIPYARD = "Buyback Program"
+# Amount of messages that get refreshed concurrently when the plugin gets enabled
+STARTUP_CONCURRENCY = 10
 
 # Database lock
 database_lock = Lock()
@@ -71,11 +74,11 @@ class AccountingPlugin(BotPlugin):
         self.config.load_tree(CONFIG_TREE)
         self.accounting_log = None  # type: int | None
         self.admin_log = None  # type: int | None
-        self.admins = []  # type: List[int]
-        self.admins_shipyard = []  # type: List[int]
+        self.admins = frozenset()  # type: FrozenSet[int]
+        self.admins_shipyard = frozenset()  # type: FrozenSet[int]
         self.guild = None  # type: int | None
         self.user_role = None  # type: int | None
-        self.timezone = "Europe/Berlin"  # type: str
+        self.timezone = ZoneInfo("Europe/Berlin")  # type: tzinfo
         self.embeds = []  # type: List[Embed]
         self.sheet = None  # type: SheetPlugin | None
         self.member_p = None  # type: MembersPlugin | None
@@ -83,15 +86,18 @@ class AccountingPlugin(BotPlugin):
         self.wallets = {}  # type: {str: int}
         self.investments = {}  # type: {str: int}
         self.wallets_last_reload = 0
+        self.wallet_task = None  # type: asyncio.Task | None
         self.menu_message = None  # type: Message | None
+        self.menu_channel = None  # type: TextChannel | None
+        self.accounting_log_channel = None  # type: TextChannel | None
+        self.menu_view = None  # type: AccountingView | None
+        self.transaction_view = None  # type: TransactionView | None
 
     def on_load(self):
-        self.accounting_log = self.config["logChannel"]
         admin_log = self.config["adminLogChannel"]
         if admin_log != -1:
             self.admin_log = admin_log
-        self.admins_shipyard = self.config["shipyard_admins"]
-        self.admins = self.config["admins"]
+        self.on_config_reload()
         self.db = AccountingDB(
             username=self.config["db.user"],
             password=self.config["db.password"],
@@ -100,7 +106,7 @@ class AccountingPlugin(BotPlugin):
             database=self.config["db.name"]
         )
         self.guild = self.config["main_guild"]
-        self.timezone = self.config["timezone"]
+        self.timezone = ZoneInfo(self.config["timezone"])
         if self.guild == -1:
             self.guild = None
         self.register_cog(AccountingCommands(self))
@@ -108,15 +114,32 @@ class AccountingPlugin(BotPlugin):
         self.sheet = self.bot.get_plugin("SheetMain")
         self.member_p = self.bot.get_plugin("MembersPlugin")
 
+    def on_config_reload(self):
+        self.accounting_log = self.config["logChannel"]
+        self.admins_shipyard = frozenset(self.config["shipyard_admins"])
+        self.admins = frozenset(self.config["admins"])
+
+    async def on_disable(self):
+        if self.wallet_task is not None and not self.wallet_task.done():
+            self.wallet_task.cancel()
+        # Views sent in this process are registered for their message ids, these take precedence over the views of a
+        # reloaded plugin. Stopped views get removed from the view store once the next view gets added.
+        if self.menu_view is not None:
+            self.menu_view.stop()
+            self.menu_view = None
+        if self.transaction_view is not None:
+            self.transaction_view.stop()
+            self.transaction_view = None
+
     def on_unload(self):
-        if self.db.con is None:
+        if self.db.pool is None:
             return
-        logger.warning("Closing SQL connection")
-        self.db.con.close()
+        logger.warning("Closing SQL connection pool")
+        self.db.close()
 
     async def get_status(self, short=False) -> Dict[str, str]:
         result = {}
-        db_ping = self.db.ping()
+        db_ping = await asyncio.to_thread(self.db.ping)
         if db_ping is not None:
             result["DB Ping"] = f"{db_ping} ms"
         else:
@@ -130,7 +153,6 @@ class AccountingPlugin(BotPlugin):
         return result
 
     async def inform_player(self, transaction, discord_id, receive):
-        time_formatted = transaction.timestamp.astimezone(pytz.timezone(self.timezone)).strftime("%d.%m.%Y %H:%M")
         if not discord_id:
             # logger.warning("Didn't receive an ID for %s (receive=%s)", str(transaction), str(receive))
             return
@@ -144,6 +166,7 @@ class AccountingPlugin(BotPlugin):
                                            default=-1)),
                 embed=transaction.create_embed())
         elif discord_id > 0:
+            time_formatted = transaction.timestamp.astimezone(self.timezone).strftime("%d.%m.%Y %H:%M")
             logger.warning("Can't inform user %s (%s) about about the transaction %s -> %s: %s (%s)",
                            transaction.name_to if receive else transaction.name_from,
                            discord_id,
@@ -152,22 +175,25 @@ class AccountingPlugin(BotPlugin):
                            f"{transaction.amount:,} ISK",
                            time_formatted)
 
-    async def save_transaction(self, transaction: "Transaction", msg: Message, user_id: int):
+    async def save_transaction(self, transaction: "Transaction", msg: Message, user_id: int,
+                               user: Union[User, Member, None] = None):
         # Check if the transaction is valid
         if transaction.amount is None or (
                 not transaction.name_from and not transaction.name_to) or not transaction.purpose:
-            logger.error(f"Invalid embed in message {msg.id}! Can't parse transaction data: {transaction}")
+            logger.error("Invalid embed in message %s! Can't parse transaction data: %s", msg.id, transaction)
             raise AccountingException("Transaction verification failed: Invalid embed")
-        time_formatted = transaction.timestamp.astimezone(pytz.timezone(self.timezone)).strftime("%d.%m.%Y %H:%M")
 
         # Save transaction to sheet
         await self.add_transaction(transaction=transaction)
-        user = await self.bot.get_or_fetch_user(user_id)
-        logger.info(f"Verified transaction {msg.id} ({time_formatted}). "
-                    f"Verified by {user.name if user is not None else None} ({user_id}).")
+        if user is None:
+            user = await self.bot.get_or_fetch_user(user_id)
+        if logger.isEnabledFor(logging.INFO):
+            time_formatted = transaction.timestamp.astimezone(self.timezone).strftime("%d.%m.%Y %H:%M")
+            logger.info("Verified transaction %s (%s). Verified by %s (%s).",
+                        msg.id, time_formatted, user.name if user is not None else None, user_id)
 
         # Set message as verified
-        self.db.set_verification(msg.id, verified=1)
+        await asyncio.to_thread(self.db.set_verification, msg.id, verified=1)
 
     async def inform_players(self, transaction: "Transaction"):
         # Update wallets
@@ -189,19 +215,20 @@ class AccountingPlugin(BotPlugin):
                 id_to = None
             await self.inform_player(transaction, id_to, receive=True)
 
-    async def save_embeds(self, msg, user_id):
+    async def save_embeds(self, msg, user_id, user: Union[User, Member, None] = None):
         """
         Saves the transaction of a message into the sheet
 
         :param msg:     The message with the transaction-embed
         :param user_id: The user ID that verified the transaction
+        :param user:    The user that verified the transaction, will be fetched if not provided
         """
         if not self.bot.is_online():
             raise BotOfflineException("Can't verify transactions when the bot is not online")
         if len(msg.embeds) == 0:
             return
         elif len(msg.embeds) > 1:
-            logger.warning(f"Message {msg.id} has more than one embed ({msg.embeds})!")
+            logger.warning("Message %s has more than one embed (%s)!", msg.id, msg.embeds)
         # Getting embed of the message should contain only one
         embed = msg.embeds[0]
         # Convert embed to Transaction
@@ -211,16 +238,17 @@ class AccountingPlugin(BotPlugin):
         else:
             transactions = [transaction]
         async with database_lock:
-            is_unverified = self.db.is_unverified_transaction(msg.id)
+            is_unverified = await asyncio.to_thread(self.db.is_unverified_transaction, msg.id)
             if not is_unverified:
-                time_formatted = transaction.timestamp.astimezone(pytz.timezone(self.timezone)).strftime(
+                time_formatted = transaction.timestamp.astimezone(self.timezone).strftime(
                     "%d.%m.%Y %H:%M")
-                logger.warning(
-                    f"Attempted to verify an already verified transaction {msg.id} ({time_formatted}), user: {user_id}.")
+                logger.warning("Attempted to verify an already verified transaction %s (%s), user: %s.",
+                               msg.id, time_formatted, user_id)
                 return
+            if user is None:
+                user = await self.bot.get_or_fetch_user(user_id)
             for transaction in transactions:
-                await self.save_transaction(transaction, msg, user_id)
-        user = await self.bot.get_or_fetch_user(user_id)
+                await self.save_transaction(transaction, msg, user_id, user)
         await asyncio.gather(
             msg.edit(content=f"Verifiziert von {user.name}", view=None),
             msg.remove_reaction("⚠️", self.bot.user),
@@ -228,17 +256,12 @@ class AccountingPlugin(BotPlugin):
             *[self.inform_players(transaction) for transaction in transactions]
         )
 
-    async def verify_transaction(self, user_id: int, message: Message, interaction: Interaction = None):
+    async def verify_transaction(self, user_id: int, message: Message, interaction: Interaction = None,
+                                 user: Union[User, Member, None] = None):
         if not self.bot.is_online():
             raise BotOfflineException()
 
-        if self.admin_log is not None:
-            admin_log_channel = self.bot.get_channel(self.admin_log)
-            if admin_log_channel is None:
-                admin_log_channel = await self.bot.fetch_channel(self.admin_log)
-        else:
-            admin_log_channel = None
-        is_unverified = self.db.is_unverified_transaction(message=message.id)
+        is_unverified = await asyncio.to_thread(self.db.is_unverified_transaction, message=message.id)
         if is_unverified is None:
             if interaction:
                 await interaction.followup.send(content="Error: Transaction not found", ephemeral=True)
@@ -253,7 +276,8 @@ class AccountingPlugin(BotPlugin):
                 await interaction.followup.send(content="Error: Couldn't parse embed", ephemeral=True)
             return
         has_permissions = user_id in self.admins
-        user = await self.bot.get_or_fetch_user(user_id)
+        if user is None:
+            user = await self.bot.get_or_fetch_user(user_id)
         if not has_permissions and isinstance(transaction,
                                               Transaction) and transaction.name_from and transaction.name_to:
             user_from = self.member_p.get_user(transaction.name_from)
@@ -292,8 +316,7 @@ class AccountingPlugin(BotPlugin):
                             ephemeral=True)
                     return
                 has_permissions = True
-                logger.info("User " + str(
-                    user_id) + " is owner of transaction " + transaction.__str__() + " and has sufficient balance")
+                logger.info("User %s is owner of transaction %s and has sufficient balance", user_id, transaction)
         if isinstance(transaction, ShipyardTransaction) and not has_permissions:
             has_permissions = user_id in self.admins_shipyard
         if not has_permissions:
@@ -303,7 +326,7 @@ class AccountingPlugin(BotPlugin):
                             "Admins dürfen Transaktionen verifizieren.", ephemeral=True)
             return
 
-        if not is_unverified:
+        if not is_unverified or message.content.startswith("Verifiziert von"):
             # The Message is already verified
             msg = "Fehler: Diese Transaktion wurde bereits verifiziert, sie wurde nicht " \
                   "erneut im Sheet eingetragen. Bitte trage sie selbstständig ein, falls " \
@@ -312,27 +335,20 @@ class AccountingPlugin(BotPlugin):
                 await interaction.followup.send(content=msg, ephemeral=True)
             else:
                 await user.send(content=msg)
-            return
-
-        if message.content.startswith("Verifiziert von"):
-            # The Message was already verified, but due to an Error it got not updated in the SQL DB
-            author = await self.bot.get_or_fetch_user(user_id)
-            msg = "Fehler: Diese Transaktion wurde bereits verifiziert, sie wurde nicht " \
-                  "erneut im Sheet eingetragen. Bitte trage sie selbstständig ein, falls " \
-                  "dies nötig ist."
-            if interaction:
-                await interaction.followup.send(content=msg, ephemeral=True)
-            else:
-                await author.send(content=msg)
-            logger.warning("Transaction %s was already verified (according to message content), but not marked as "
-                           "verified in the database.", transaction.__str__())
-            self.db.set_verification(message.id, True)
-            await message.edit(view=None)
+            if is_unverified:
+                # The Message was already verified, but due to an Error it got not updated in the SQL DB
+                logger.warning("Transaction %s was already verified (according to message content), but not marked "
+                               "as verified in the database.", transaction.__str__())
+                await asyncio.to_thread(self.db.set_verification, message.id, True)
+                await message.edit(view=None)
             return
 
         # Save transaction
-        await self.save_embeds(message, user_id)
-        if admin_log_channel and (user_id not in self.admins):
+        await self.save_embeds(message, user_id, user)
+        admin_log_channel = None
+        if self.admin_log is not None and user_id not in self.admins:
+            admin_log_channel = await self.bot.get_or_fetch_channel(self.admin_log)
+        if admin_log_channel:
             msg = "Transaction `{}` was self-verified by `{}:{}`:\nhttps://discord.com/channels/{}/{}/{}\n" \
                 .format(transaction, user.name, user_id, self.guild, self.accounting_log, message.id)
             await admin_log_channel.send(msg)
@@ -370,7 +386,7 @@ class AccountingPlugin(BotPlugin):
         # Get data from transaction
         user_f = transaction.name_from if transaction.name_from is not None else ""
         user_t = transaction.name_to if transaction.name_to is not None else ""
-        transaction_time = transaction.timestamp.astimezone(pytz.timezone(self.timezone)).strftime("%d.%m.%Y %H:%M")
+        transaction_time = transaction.timestamp.astimezone(self.timezone).strftime("%d.%m.%Y %H:%M")
         amount = transaction.amount
         purpose = transaction.purpose if transaction.purpose is not None else ""
         reference = transaction.reference if transaction.reference is not None else ""
@@ -380,7 +396,7 @@ class AccountingPlugin(BotPlugin):
         user_t = self.sheet.check_name_overwrites(user_t)
 
         # Saving the data
-        logger.info(f"Saving row [{transaction_time}; {user_f}; {user_t}; {amount}; {purpose}; {reference}]")
+        logger.info("Saving row [%s; %s; %s; %s; %s; %s]", transaction_time, user_f, user_t, amount, purpose, reference)
         sheet = await self.sheet.get_sheet()
         wk_log = await sheet.worksheet("Accounting Log")
         await wk_log.append_row([transaction_time, user_f, user_t, amount, purpose, reference],
@@ -413,6 +429,15 @@ class AccountingPlugin(BotPlugin):
                             pass
                         self.investments[u[0]] = int(inv)
 
+    @staticmethod
+    def _on_wallets_loaded(task: asyncio.Task):
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            utils.log_error(logger, task.exception(), location="load_wallets")
+            return
+        logger.info("Loaded wallets")
+
     async def get_balance(self, name: str, default: Optional[int] = None) -> int:
         async with self.wallet_lock:
             name = self.member_p.get_main_name(name)
@@ -442,91 +467,149 @@ class AccountingPlugin(BotPlugin):
         return p.parse_player(string)
 
     async def on_enable(self):
+        channel, accounting_log = await asyncio.gather(
+            self.bot.get_or_fetch_channel(self.config["menuChannel"]),
+            self.bot.get_or_fetch_channel(self.config["logChannel"])
+        )
+        self.menu_channel = channel
+        self.accounting_log_channel = accounting_log
+
+        # The menu view is persistent, the buttons of the menu and all shortcuts will be handled by this view
+        view = AccountingView(self)
+        self.bot.add_view(view)
+        self.menu_view = view
+        # Same for the transaction view, one instance handles the buttons of all transaction messages
+        self.transaction_view = TransactionView(self)
+        self.bot.add_view(self.transaction_view)
+
         # Refreshing main menu
-        channel = await self.bot.fetch_channel(self.config["menuChannel"])
         msg = await channel.fetch_message(self.config["menuMessage"])
-        await msg.edit(view=AccountingView(self),
-                       embeds=self.embeds, content="")
+        if not is_menu_up_to_date(msg, self.embeds):
+            await msg.edit(view=view, embeds=self.embeds, content="")
         self.menu_message = msg
 
         # Updating shortcut menus
-        shortcuts = self.db.get_shortcuts()
-        logger.info(f"Found {len(shortcuts)} shortcut menus")
-        for (m, c) in shortcuts:
-            chan = self.bot.get_channel(c)
-            if chan is None:
-                chan = self.bot.fetch_channel(c)
-            try:
-                msg = await chan.fetch_message(m)
-                await msg.edit(view=AccountingView(self),
-                               embed=self.bot.embeds["MenuShortcut"], content="")
-            except discord.errors.NotFound:
-                logger.warning(f"Message {m} in channel {c} not found, deleting it from DB")
-                self.db.delete_shortcut(m)
+        shortcuts = await asyncio.to_thread(self.db.get_shortcuts)
+        logger.info("Found %s shortcut menus", len(shortcuts))
+        # The semaphore limits the concurrent requests, a slow message doesn't hold back the following ones
+        sem = asyncio.Semaphore(STARTUP_CONCURRENCY)
+        await asyncio.gather(*[_limited(sem, self._refresh_shortcut(view, m, c)) for (m, c) in shortcuts])
 
-        await self.load_wallets(force=True, validate=True)
+        # The wallets get loaded in the background, get_balance will wait for the wallet lock until they are loaded
+        self.wallet_task = asyncio.create_task(self.load_wallets(force=True, validate=True))
+        self.wallet_task.add_done_callback(self._on_wallets_loaded)
 
         # Updating unverified Accounting-log entries
         logger.info("Refreshing unverified accounting log entries")
-        accounting_log = await self.bot.fetch_channel(self.config["logChannel"])
-        unverified = self.db.get_unverified()
-        logger.info(f"Found {len(unverified)} unverified message(s)")
-        for m in unverified:
+        unverified = await asyncio.to_thread(self.db.get_unverified)
+        logger.info("Found %s unverified message(s)", len(unverified))
+        # Deleted and already verified messages are collected and updated in the database at once
+        to_delete = []  # type: List[int]
+        to_verify = []  # type: List[int]
+        results = await asyncio.gather(*[
+            _limited(sem, self._refresh_unverified(accounting_log, m, to_delete, to_verify)) for m in unverified
+        ], return_exceptions=True)
+        for m, res in zip(unverified, results):
+            if isinstance(res, Exception):
+                logger.error("Failed to refresh unverified transaction %s", m)
+                utils.log_error(logger, res, location="accounting_enable", minimal=True)
+        if len(to_delete) > 0:
+            logger.info("Deleting %s missing transaction(s) from the database", len(to_delete))
+            await asyncio.to_thread(self.db.delete_many, to_delete)
+        if len(to_verify) > 0:
+            await asyncio.to_thread(self.db.set_verification_many, to_verify, 1)
+        logger.info("AccountingPlugin ready")
+
+    async def _refresh_shortcut(self, view: "AccountingView", m: int, c: int):
+        chan = await self.bot.get_or_fetch_channel(c)
+        if chan is None:
+            logger.warning("Channel %s of shortcut message %s not found or not accessible", c, m)
+            return
+        try:
+            msg = await chan.fetch_message(m)
+            if not is_menu_up_to_date(msg, [self.bot.embeds["MenuShortcut"]]):
+                await msg.edit(view=view, embed=self.bot.embeds["MenuShortcut"], content="")
+        except discord.errors.NotFound:
+            logger.warning("Message %s in channel %s not found, deleting it from DB", m, c)
+            await asyncio.to_thread(self.db.delete_shortcut, m)
+
+    async def _refresh_unverified(self,
+                                  accounting_log: TextChannel,
+                                  m: int,
+                                  to_delete: List[int],
+                                  to_verify: List[int]):
+        try:
+            msg = await accounting_log.fetch_message(m)
+        except discord.errors.NotFound:
+            to_delete.append(m)
+            return
+        if msg.content.startswith("Verifiziert von"):
+            logger.warning("Transaction already verified but not inside database: %s: %s", msg.id, msg.content)
+            to_verify.append(m)
+            return
+        v = False  # Was the transaction verified while the bot was offline?
+        user = None  # User who verified the message
+        # Finding the checkmark below the message
+        checkmark = next((r for r in msg.reactions
+                          if (r.emoji if isinstance(r.emoji, str) else r.emoji.name) == "✅"), None)
+        # The users only have to be fetched if someone besides the bot reacted
+        if checkmark is not None and checkmark.count > (1 if checkmark.me else 0):
+            # Iterating lazily, the remaining pages of users are not needed once an admin is found
+            async for u in checkmark.users():
+                if u.id in self.admins:
+                    # User is admin, the transaction is therefore verified
+                    v = True
+                    user = u
+                    break
+        if v:
+            # The Message was verified
             try:
-                msg = await accounting_log.fetch_message(m)
-            except discord.errors.NotFound:
-                self.db.delete(m)
-                continue
-            if msg.content.startswith("Verifiziert von"):
-                logger.warning("Transaction already verified but not inside database: %s: %s", msg.id, msg.content)
-                self.db.set_verification(m, 1)
-                continue
-            v = False  # Was the transaction verified while the bot was offline?
-            user = None  # User ID who verified the message
-            # Checking all the reactions below the message
-            for r in msg.reactions:
-                emoji = r.emoji
-                if isinstance(emoji, str):
-                    name = emoji
-                else:
-                    name = emoji.name
-                if name != "✅":
-                    continue
-                users = await r.users().flatten()
-                for u in users:
-                    if u.id in self.config["admins"]:
-                        # User is admin, the transaction is therefore verified
-                        v = True
-                        user = u.id
-                        break
-                break
-            if v:
-                # The Message was verified
-                try:
-                    # Saving transaction to the Google sheet
-                    await self.save_embeds(msg, user)
-                except mariadb.Error:
-                    pass
-                # Removing the View
-                await msg.edit(view=None)
+                # Saving transaction to the Google sheet
+                await self.save_embeds(msg, user.id, user)
+            except mariadb.Error as e:
+                # The transaction stays unverified inside the database and will be checked again on the next start
+                logger.error("Failed to save transaction %s that was verified while the bot was offline", msg.id)
+                utils.log_error(logger, e, location="accounting_enable")
+                return
+            # Removing the View
+            await msg.edit(view=None)
+        else:
+            # Updating the message View, so it can be used by the users
+            await msg.edit(view=self.transaction_view)
+            if len(msg.embeds) > 0:
+                transaction = self.transaction_from_embed(msg.embeds[0])
+                state = await transaction.get_state(self)
+                if state == 2:
+                    await msg.add_reaction("⚠️")
+                elif state == 3:
+                    await msg.add_reaction("❌")
             else:
-                # Updating the message View, so it can be used by the users
-                await msg.edit(view=TransactionView(self))
-                if len(msg.embeds) > 0:
-                    transaction = self.transaction_from_embed(msg.embeds[0])
-                    state = await transaction.get_state(self)
-                    if state == 2:
-                        await msg.add_reaction("⚠️")
-                    elif state == 3:
-                        await msg.add_reaction("❌")
-                else:
-                    logger.warning("Message %s is listed as transaction but does not have an embed", msg.id)
-        logger.info("AccountingPlugin ready")
+                logger.warning("Message %s is listed as transaction but does not have an embed", msg.id)
 
     def get_messages(self) -> List[Optional[discord.Message]]:
         return [self.menu_message]
 
 
+async def _limited(sem: asyncio.Semaphore, coro: Awaitable[_T]) -> _T:
+    async with sem:
+        return await coro
+
+
+def is_menu_up_to_date(message: Message, embeds: List[Embed]) -> bool:
+    """
+    Checks whether a menu message already has the persistent :class:`AccountingView` attached and shows the given
+    embeds, in that case the message doesn't need to be edited.
+
+    :param message: The menu message
+    :param embeds: The expected embeds
+    :return: True if the message is up-to-date
+    """
+    custom_ids = [c.custom_id for row in message.components for c in getattr(row, "children", [])]
+    if custom_ids != AccountingView.CUSTOM_IDS or message.content != "":
+        return False
+    return [e.to_dict() for e in message.embeds] == [e.to_dict() for e in embeds]
+
+
 def main_guild_only() -> Callable[[_T], _T]:
     def decorator(func):
         @utils.cmd_check
@@ -563,20 +646,24 @@ class AccountingCommands(Cog):
 
     @Cog.listener()
     async def on_raw_reaction_add(self, reaction: RawReactionActionEvent):
-        if reaction.emoji.name == "✅" and reaction.channel_id == self.config["logChannel"]:
+        if reaction.emoji.name == "✅" and reaction.channel_id == self.plugin.accounting_log:
             # The Message is not verified
-            channel = self.bot.get_channel(self.config["logChannel"])
+            channel = self.plugin.accounting_log_channel
+            if channel is None or channel.id != reaction.channel_id:
+                channel = await self.bot.get_or_fetch_channel(reaction.channel_id)
+                self.plugin.accounting_log_channel = channel
             msg = await channel.fetch_message(reaction.message_id)
-            await self.plugin.verify_transaction(reaction.user_id, msg)
+            # Guild reactions already carry the member, no need to fetch the user again
+            await self.plugin.verify_transaction(reaction.user_id, msg, user=reaction.member)
 
     @Cog.listener()
     async def on_raw_reaction_remove(self, reaction: RawReactionActionEvent):
         if (
-                reaction.emoji.name == "✅" and
-                reaction.channel_id == self.config["logChannel"] and
-                reaction.user_id in self.config["admins"]
+                reaction.channel_id == self.plugin.accounting_log and
+                reaction.user_id in self.plugin.admins and
+                reaction.emoji.name == "✅"
         ):
-            logger.info(f"{reaction.user_id} removed checkmark from {reaction.message_id}!")
+            logger.info("%s removed checkmark from %s!", reaction.user_id, reaction.message_id)
 
     @commands.slash_command(description="Creates the main menu for the bot and sets all required settings")
     @admin_only()
@@ -584,13 +671,13 @@ class AccountingCommands(Cog):
     @guild_only()
     async def setup(self, ctx: ApplicationContext):
         logger.info("User verified for setup-command, starting setup...")
-        view = AccountingView(self.plugin)
-        msg = await ctx.send(view=view, embeds=self.plugin.embeds)
-        logger.info("Send menu message with id " + str(msg.id))
+        msg = await ctx.send(view=self.plugin.menu_view, embeds=self.plugin.embeds)
+        logger.info("Send menu message with id %s", msg.id)
         self.config["menuMessage"] = msg.id
         self.config["menuChannel"] = ctx.channel.id
+        self.plugin.menu_channel = ctx.channel
         self.config["main_guild"] = ctx.guild.id
-        self.bot.save_config()
+        await self.bot.save_config_async()
         logger.info("Setup completed.")
         await ctx.response.send_message("Saved config", ephemeral=True)
 
@@ -603,7 +690,9 @@ class AccountingCommands(Cog):
     async def set_log_channel(self, ctx):
         logger.info("User Verified. Setting up channel...")
         self.config["logChannel"] = ctx.channel.id
-        self.bot.save_config()
+        self.plugin.accounting_log = ctx.channel.id
+        self.plugin.accounting_log_channel = ctx.channel
+        await self.bot.save_config_async()
         logger.info("Channel changed!")
         await ctx.respond(f"Log channel set to this channel (`{self.config['logChannel']}`)")
 
@@ -613,12 +702,11 @@ class AccountingCommands(Cog):
     @guild_only()
     async def createshortcut(self, ctx):
         if ctx.author.guild_permissions.administrator or ctx.author.id in self.plugin.admins or ctx.author.id == self.owner:
-            view = AccountingView(self.plugin)
-            msg = await ctx.send(view=view, embed=self.bot.embeds["MenuShortcut"])
+            msg = await ctx.send(view=self.plugin.menu_view, embed=self.bot.embeds["MenuShortcut"])
             self.connector.add_shortcut(msg.id, ctx.channel.id)
             await ctx.respond("Shortcut menu posted", ephemeral=True)
         else:
-            logger.info(f"User {ctx.author.id} is missing permissions to run the createshortcut command")
+            logger.info("User %s is missing permissions to run the createshortcut command", ctx.author.id)
             await ctx.respond("Missing permissions", ephemeral=True)
 
     @commands.slash_command(name="balance", description="Get the balance of a user")
@@ -797,7 +885,7 @@ class Transaction(TransactionLike):
         """
         transaction_type = self.detect_type()
         if transaction_type < 0:
-            logger.error(f"Unexpected transaction type: {transaction_type}")
+            logger.error("Unexpected transaction type: %s", transaction_type)
 
         embed = Embed(title=Transaction.NAMES[transaction_type],
                       color=Transaction.COLORS[transaction_type],
@@ -836,17 +924,19 @@ class Transaction(TransactionLike):
         """
         transaction = Transaction(author=author)
         warnings = ""
+        title = modal.title.casefold()
         for field in modal.children:
             # Processing all fields of the modal
+            label = field.label.casefold()
             name_type = -1
-            if field.label.casefold() == "Von".casefold():
+            if label == "Von".casefold():
                 name_type = 0
-            elif field.label.casefold() == "Zu".casefold():
+            elif label == "Zu".casefold():
                 name_type = 1
-            elif field.label.casefold() == "Spieler(konto)name".casefold():
-                if modal.title.casefold() == "Einzahlen".casefold():
+            elif label == "Spieler(konto)name".casefold():
+                if title == "Einzahlen".casefold():
                     name_type = 1
-                if modal.title.casefold() == "Auszahlen".casefold():
+                if title == "Auszahlen".casefold():
                     name_type = 0
             if name_type != -1:
                 name, match = plugin.parse_player(field.value.strip())
@@ -861,7 +951,7 @@ class Transaction(TransactionLike):
                 if name_type == 1:
                     transaction.name_to = name
                 continue
-            if field.label.casefold() == "Menge".casefold():
+            if label == "Menge".casefold():
                 raw = field.value
 
                 amount, warn = parse_number(raw)
@@ -871,10 +961,10 @@ class Transaction(TransactionLike):
                     return None, warnings
                 transaction.amount = amount
                 continue
-            if field.label.casefold() == "Verwendungszweck".casefold():
+            if label == "Verwendungszweck".casefold():
                 transaction.purpose = field.value.strip()
                 continue
-            if field.label.casefold() == "Referenz".casefold():
+            if label == "Referenz".casefold():
                 transaction.reference = field.value.strip()
 
         # Check wallet ownership and balance
@@ -903,7 +993,7 @@ class Transaction(TransactionLike):
         return transaction, warnings
 
     @staticmethod
-    def from_embed(embed: Embed, timezone: str) -> Optional['Transaction']:
+    def from_embed(embed: Embed, timezone: tzinfo) -> Optional['Transaction']:
         """
         Creates a Transaction from an existing :class:`Embed`.
 
@@ -924,7 +1014,7 @@ class Transaction(TransactionLike):
                 transaction.purpose = field.value
             if name == "Referenz".casefold():
                 transaction.reference = field.value
-        transaction.timestamp = embed.timestamp.astimezone(pytz.timezone(timezone))
+        transaction.timestamp = embed.timestamp.astimezone(timezone)
         if embed.footer is not None:
             transaction.author = embed.footer.text
         if not transaction.is_valid():
@@ -951,7 +1041,7 @@ class PackedTransaction(ABC):
 
     @staticmethod
     @abstractmethod
-    def from_embed(embed: Embed, timezone: str) -> "PackedTransaction":
+    def from_embed(embed: Embed, timezone: tzinfo) -> "PackedTransaction":
         pass
 
 
@@ -1038,7 +1128,7 @@ class ShipyardTransaction(PackedTransaction):
         return embed
 
     @staticmethod
-    def from_embed(embed: Embed, timezone: str) -> "ShipyardTransaction":
+    def from_embed(embed: Embed, timezone: tzinfo) -> "ShipyardTransaction":
         transaction = ShipyardTransaction()
         for field in embed.fields:
             name = field.name.casefold()
@@ -1052,7 +1142,7 @@ class ShipyardTransaction(PackedTransaction):
                 transaction.station_fees = parse_number(field.value)[0]
             if name == "Bauer".casefold():
                 transaction.builder = field.value
-        transaction.timestamp = embed.timestamp.astimezone(pytz.timezone(timezone))
+        transaction.timestamp = embed.timestamp.astimezone(timezone)
         if embed.footer is not None:
             transaction.author = embed.footer.text
         return transaction
@@ -1082,9 +1172,9 @@ async def send_transaction(plugin: AccountingPlugin,
         if isinstance(embed, PackedTransaction):
             transaction = embed
             embed = transaction.to_embed()
-        msg = await plugin.bot.get_channel(plugin.accounting_log).send(embeds=[embed], view=TransactionView(plugin))
+        msg = await plugin.bot.get_channel(plugin.accounting_log).send(embeds=[embed], view=plugin.transaction_view)
         try:
-            plugin.db.add_transaction(msg.id, interaction.user.id)
+            await asyncio.to_thread(plugin.db.add_transaction, msg.id, interaction.user.id)
             if transaction is None:
                 transaction = plugin.transaction_from_embed(embed)
                 if isinstance(transaction, ShipyardTransaction):
@@ -1102,9 +1192,9 @@ async def send_transaction(plugin: AccountingPlugin,
             elif state == 3:
                 await msg.add_reaction("❌")
             if state is not None:
-                plugin.db.set_state(msg.id, state)
+                await asyncio.to_thread(plugin.db.set_state, msg.id, state)
             if transaction.self_verification():
-                plugin.db.set_ocr_verification(msg.id, True)
+                await asyncio.to_thread(plugin.db.set_ocr_verification, msg.id, True)
         except mariadb.Error as e:
             note += "\nFehler beim Eintragen in die Datenbank, die Transaktion wurde jedoch trotzdem im " \
                     f"Accountinglog gepostet. Informiere bitte einen Admin, danke.\n{e}"
@@ -1120,11 +1210,14 @@ class AccountingView(AutoDisableView):
     the printer button responds with a list of all links to all unverified transactions.
     """
 
+    CUSTOM_IDS = ["accounting:transfer", "accounting:deposit", "accounting:withdraw", "accounting:shipyard",
+                  "accounting:list"]
+
     def __init__(self, plugin: AccountingPlugin):
         super().__init__(timeout=None)
         self.plugin = plugin
 
-    @discord.ui.button(label="Transfer", style=discord.ButtonStyle.blurple)
+    @discord.ui.button(label="Transfer", style=discord.ButtonStyle.blurple, custom_id="accounting:transfer")
     async def btn_transfer_callback(self, button, interaction):
         if not self.plugin.bot.is_online():
             raise BotOfflineException()
@@ -1132,7 +1225,7 @@ class AccountingView(AutoDisableView):
         modal = TransferModal(title="Transfer", color=Color.blue(), plugin=self.plugin, name_from=user_name)
         await interaction.response.send_modal(modal)
 
-    @discord.ui.button(label="Einzahlen", style=discord.ButtonStyle.green)
+    @discord.ui.button(label="Einzahlen", style=discord.ButtonStyle.green, custom_id="accounting:deposit")
     async def btn_deposit_callback(self, button, interaction):
         if not self.plugin.bot.is_online():
             raise BotOfflineException()
@@ -1141,7 +1234,7 @@ class AccountingView(AutoDisableView):
                               special=True, purpose="Einzahlung Accounting", name_to=user_name)
         await interaction.response.send_modal(modal)
 
-    @discord.ui.button(label="Auszahlen", style=discord.ButtonStyle.red)
+    @discord.ui.button(label="Auszahlen", style=discord.ButtonStyle.red, custom_id="accounting:withdraw")
     async def btn_withdraw_callback(self, button, interaction):
         if not self.plugin.bot.is_online():
             raise BotOfflineException()
@@ -1150,29 +1243,31 @@ class AccountingView(AutoDisableView):
                               special=True, purpose="Auszahlung Accounting", name_from=user_name)
         await interaction.response.send_modal(modal)
 
-    @discord.ui.button(label="Shipyard", style=discord.ButtonStyle.grey)
+    @discord.ui.button(label="Shipyard", style=discord.ButtonStyle.grey, custom_id="accounting:shipyard")
     async def btn_shipyard_callback(self, button, interaction):
         if not self.plugin.bot.is_online():
             raise BotOfflineException()
         modal = ShipyardModal(title="Schiffskauf", color=Color.red(), plugin=self.plugin)
         await interaction.response.send_modal(modal)
 
-    @discord.ui.button(emoji="🖨️", style=discord.ButtonStyle.grey)
+    @discord.ui.button(emoji="🖨️", style=discord.ButtonStyle.grey, custom_id="accounting:list")
     async def btn_list_transactions_callback(self, button, interaction):
         if not self.plugin.bot.is_online():
             raise BotOfflineException()
-        unverified = self.plugin.db.get_unverified(include_user=True)
-        msg = "Unverifizierte Transaktionen:"
+        unverified = await asyncio.to_thread(self.plugin.db.get_unverified, include_user=True)
+        lines = ["Unverifizierte Transaktionen:"]
         if len(unverified) == 0:
-            msg += "\nKeine"
-        i = 0
-        for (msg_id, user_id) in unverified:
-            if len(msg) < 1900:
-                msg += f"\nhttps://discord.com/channels/{self.plugin.guild}/{self.plugin.accounting_log}/{msg_id} von <@{user_id}>"
-                i += 1
-            else:
-                msg += f"\nUnd {len(unverified) - i} weitere..."
-        await interaction.response.send_message(msg, ephemeral=True)
+            lines.append("Keine")
+        length = len(lines[0])
+        url_prefix = f"https://discord.com/channels/{self.plugin.guild}/{self.plugin.accounting_log}/"
+        for i, (msg_id, user_id) in enumerate(unverified):
+            if length >= 1900:
+                lines.append(f"Und {len(unverified) - i} weitere...")
+                break
+            line = f"{url_prefix}{msg_id} von <@{user_id}>"
+            lines.append(line)
+            length += len(line) + 1
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
 
 
 # noinspection PyUnusedLocal
@@ -1187,18 +1282,18 @@ class TransactionView(AutoDisableView):
         super().__init__(timeout=None)
         self.plugin = plugin
 
-    @discord.ui.button(label="Verifizieren", style=discord.ButtonStyle.green)
+    @discord.ui.button(label="Verifizieren", style=discord.ButtonStyle.green, custom_id="transaction:verify")
     async def btn_verify_callback(self, button: discord.Button, interaction: Interaction):
         if not self.plugin.bot.is_online():
             raise BotOfflineException()
         await interaction.response.defer(ephemeral=True, invisible=False)
-        await self.plugin.verify_transaction(interaction.user.id, interaction.message, interaction)
+        await self.plugin.verify_transaction(interaction.user.id, interaction.message, interaction, interaction.user)
 
-    @discord.ui.button(label="Löschen", style=discord.ButtonStyle.red)
+    @discord.ui.button(label="Löschen", style=discord.ButtonStyle.red, custom_id="transaction:delete")
     async def btn_delete_callback(self, button, interaction):
         if not self.plugin.bot.is_online():
             raise BotOfflineException()
-        (owner, verified) = self.plugin.db.get_owner(interaction.message.id)
+        (owner, verified) = await asyncio.to_thread(self.plugin.db.get_owner, interaction.message.id)
         transaction = self.plugin.transaction_from_embed(interaction.message.embeds[0])
         user_name = self.plugin.member_p.find_main_name(discord_id=interaction.user.id)[0]
         has_perm = owner == interaction.user.id or interaction.user.id in self.plugin.admins
@@ -1206,7 +1301,7 @@ class TransactionView(AutoDisableView):
             has_perm = transaction.has_permissions(user_name, self.plugin, "delete")
         if not verified and has_perm:
             await interaction.message.delete()
-            self.plugin.db.delete(interaction.message.id)
+            await asyncio.to_thread(self.plugin.db.delete, interaction.message.id)
             await interaction.response.send_message("Transaktion Gelöscht!", ephemeral=True)
             logger.info("User %s deleted message %s", interaction.user.id, interaction.message.id)
         elif owner != interaction.user.id:
@@ -1215,11 +1310,11 @@ class TransactionView(AutoDisableView):
         else:
             await interaction.response.send_message("Bereits verifiziert!", ephemeral=True)
 
-    @discord.ui.button(label="Bearbeiten", style=discord.ButtonStyle.blurple)
+    @discord.ui.button(label="Bearbeiten", style=discord.ButtonStyle.blurple, custom_id="transaction:edit")
     async def btn_edit_callback(self, button, interaction):
         if not self.plugin.bot.is_online():
             raise BotOfflineException()
-        (owner, verified) = self.plugin.db.get_owner(interaction.message.id)
+        (owner, verified) = await asyncio.to_thread(self.plugin.db.get_owner, interaction.message.id)
         if not verified and (owner == interaction.user.id or interaction.user.id in self.plugin.admins):
             embed = interaction.message.embeds[0]
             await interaction.response.send_modal(EditModal(plugin=self.plugin, message=interaction.message, title=embed.title))
@@ -1283,9 +1378,9 @@ class ConfirmEditView(AutoDisableView):
         warnings = ""
         if self.original.name_to != transaction.name_to or self.original.name_from != transaction.name_from or \
                 self.original.amount != transaction.amount or self.original.purpose != transaction.purpose:
-            ocr_verified = self.plugin.db.get_ocr_verification(interaction.message.id)
+            ocr_verified = await asyncio.to_thread(self.plugin.db.get_ocr_verification, interaction.message.id)
             if ocr_verified:
-                self.plugin.db.set_ocr_verification(interaction.message.id, False)
+                await asyncio.to_thread(self.plugin.db.set_ocr_verification, interaction.message.id, False)
                 warnings += "Warnung: Du kannst diese Transaktion nicht mehr selbst verifizieren.\n"
         await self.message.edit(embeds=interaction.message.embeds)
         await interaction.response.send_message(f"Transaktion bearbeitet!\n{warnings}", ephemeral=True)
@@ -1381,9 +1476,9 @@ class EditModal(TransferModal):
             return
         if original.name_to != transaction.name_to or original.name_from != transaction.name_from or \
                 original.amount != transaction.amount or original.purpose != transaction.purpose:
-            ocr_verified = self.plugin.db.get_ocr_verification(interaction.message.id)
+            ocr_verified = await asyncio.to_thread(self.plugin.db.get_ocr_verification, interaction.message.id)
             if ocr_verified:
-                self.plugin.db.set_ocr_verification(interaction.message.id, False)
+                await asyncio.to_thread(self.plugin.db.set_ocr_verification, interaction.message.id, False)
                 warnings += "Warnung: Du kannst diese Transaktion nicht mehr selbst verifizieren.\n"
         await interaction.message.edit(embed=transaction.create_embed())
         await interaction.response.send_message(f"Transaktionen wurde editiert!\n{warnings}", ephemeral=True)
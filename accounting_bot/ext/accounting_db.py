@@ -1,10 +1,12 @@
 import logging
+import threading
+import time
 from datetime import datetime
 from time import sleep
 from typing import Union, Optional, Tuple, List, Sequence
 
 import mariadb
-from mariadb import Cursor, Connection
+from mariadb import Connection, ConnectionPool
 
 from accounting_bot import utils
 from accounting_bot.exceptions import DatabaseException
@@ -13,14 +15,19 @@ logger = logging.getLogger("ext.accounting.db")
 
 
 class AccountingDB:
-    def __init__(self, username: str, password: str, host: str, port: str, database: str) -> None:
-        self.cursor = None  # type: Cursor | None
-        self.con = None  # type: Connection | None
+    POOL_NAME = "accounting_bot"
+    # Maximum time in seconds to wait for a free connection if all connections of the pool are in use
+    POOL_TIMEOUT = 10
+
+    def __init__(self, username: str, password: str, host: str, port: str, database: str, pool_size: int = 10) -> None:
+        self.pool = None  # type: ConnectionPool | None
+        self._connect_lock = threading.Lock()
         self.username = username
         self.password = password
         self.host = host
         self.port = port
         self.database = database
+        self.pool_size = pool_size
         connected = False
         counter = 0
         while not connected and counter < 5:
@@ -30,15 +37,19 @@ class AccountingDB:
                 connected = True
             except mariadb.Error:
                 counter += 1
-                logger.warning(f"Retrying connection in {counter * 2} seconds")
+                logger.warning("Retrying connection in %s seconds", counter * 2)
                 sleep(counter * 2)
         if not connected:
             raise DatabaseException(f"Couldn't connect to MariaDB database on {self.host}:{self.port}")
 
     def try_connect(self) -> None:
         logger.info("Connecting to database...")
+        self.close()
         try:
-            self.con = mariadb.connect(
+            # Every query borrows its own connection, so queries from different threads don't block each other
+            self.pool = mariadb.ConnectionPool(
+                pool_name=AccountingDB.POOL_NAME,
+                pool_size=self.pool_size,
                 user=self.username,
                 password=self.password,
                 host=self.host,
@@ -47,250 +58,321 @@ class AccountingDB:
                 connect_timeout=8
             )
             logger.info("Connected to database!")
-            self.cursor = self.con.cursor()
-            self.cursor.execute("CREATE TABLE IF NOT EXISTS messages ("
-                                "msgID BIGINT NOT NULL, "
-                                "userID BIGINT NOT NULL, "
-                                "verified BIT NOT NULL DEFAULT b'0', "
-                                "t_state TINYINT, "
-                                "ocr_verified BIT NOT NULL DEFAULT b'0', "
-                                "PRIMARY KEY (msgID)"
-                                ") ENGINE = InnoDB; ")
-            self.cursor.execute("CREATE TABLE IF NOT EXISTS shortcuts ("
-                                "msgID BIGINT NOT NULL, "
-                                "channelID BIGINT NOT NULL, "
-                                "PRIMARY KEY (msgID)"
-                                ") ENGINE = InnoDB; ")
+            with self.pool.get_connection() as con:
+                cursor = con.cursor()
+                cursor.execute("CREATE TABLE IF NOT EXISTS messages ("
+                               "msgID BIGINT NOT NULL, "
+                               "userID BIGINT NOT NULL, "
+                               "verified BIT NOT NULL DEFAULT b'0', "
+                               "t_state TINYINT, "
+                               "ocr_verified BIT NOT NULL DEFAULT b'0', "
+                               "PRIMARY KEY (msgID)"
+                               ") ENGINE = InnoDB; ")
+                cursor.execute("CREATE TABLE IF NOT EXISTS shortcuts ("
+                               "msgID BIGINT NOT NULL, "
+                               "channelID BIGINT NOT NULL, "
+                               "PRIMARY KEY (msgID)"
+                               ") ENGINE = InnoDB; ")
         except mariadb.Error as e:
-            logger.error(f"Error connecting to MariaDB Platform: {e}")
+            logger.error("Error connecting to MariaDB Platform: %s", e)
+            self.close()
             raise e
 
+    def close(self) -> None:
+        if self.pool is None:
+            return
+        try:
+            self.pool.close()
+        except mariadb.Error as e:
+            logger.warning("Error while closing the connection pool: %s", e)
+        self.pool = None
+
+    def get_connection(self) -> Connection:
+        """
+        Borrows a connection from the pool, it will be returned to the pool once it gets closed. If all connections
+        are in use, waits up to :attr:`POOL_TIMEOUT` seconds for one to become available.
+
+        :return: The connection
+        :raise mariadb.PoolError: If no connection became available in time
+        """
+        if self.pool is None:
+            with self._connect_lock:
+                # Another thread might have reconnected while this one was waiting for the lock
+                if self.pool is None:
+                    self.try_connect()
+        deadline = time.monotonic() + AccountingDB.POOL_TIMEOUT
+        while True:
+            try:
+                con = self.pool.get_connection()
+                if con is not None:
+                    return con
+            except mariadb.PoolError:
+                if time.monotonic() >= deadline:
+                    raise
+            else:
+                if time.monotonic() >= deadline:
+                    raise mariadb.PoolError(f"No connection available in pool {AccountingDB.POOL_NAME}")
+            sleep(0.05)
+
     def ping(self):
         try:
-            if self.con is None or not self.con.open:
-                self.try_connect()
-            start = datetime.now()
-            self.con.ping()
-            return (datetime.now() - start).microseconds
+            with self.get_connection() as con:
+                start = datetime.now()
+                con.ping()
+                return (datetime.now() - start).microseconds
         except mariadb.Error as e:
             utils.log_error(logger, e)
             return None
 
-    def execute_statement(self, statement: str, data: Sequence = ()) -> Cursor:
-        if self.con is None or not self.con.open:
-            self.try_connect()
+    def execute_statement(self, statement: str, data: Sequence = ()) -> List[Tuple]:
         try:
-            self.cursor.execute(statement, data)
-            self.con.commit()
-            return self.cursor
+            with self.get_connection() as con:
+                cursor = con.cursor()
+                cursor.execute(statement, data)
+                con.commit()
+                return cursor.fetchall() if cursor.description is not None else []
         except mariadb.Error as e:
             logger.error("Error while trying to execute statement %s: %s", statement, e)
             raise e
 
     def add_transaction(self, message: int, user: int) -> None:
-        logger.debug(f"Saving transaction to database with msg {str(message)} and user {str(user)}")
-        if self.con is None or not self.con.open:
-            self.try_connect()
+        logger.debug("Saving transaction to database with msg %s and user %s", message, user)
         try:
-            self.cursor.execute(
-                "INSERT INTO messages (msgID, userID) VALUES (?, ?);",
-                (message, user))
-            self.con.commit()
+            with self.get_connection() as con:
+                cursor = con.cursor()
+                cursor.execute(
+                    "INSERT INTO messages (msgID, userID) VALUES (?, ?);",
+                    (message, user))
+                con.commit()
         except mariadb.Error as e:
-            logger.error(f"Error while trying to insert a new transaction: {e}")
+            logger.error("Error while trying to insert a new transaction: %s", e)
             raise e
 
     def set_state(self, message: int, state: int) -> None:
-        if self.con is None or not self.con.open:
-            self.try_connect()
         try:
-            self.cursor.execute(
-                "UPDATE messages SET t_state = ? WHERE messages.msgID=?;",
-                (state, message))
-            self.con.commit()
-            return self.cursor.rowcount
+            with self.get_connection() as con:
+                cursor = con.cursor()
+                cursor.execute(
+                    "UPDATE messages SET t_state = ? WHERE messages.msgID=?;",
+                    (state, message))
+                con.commit()
+                return cursor.rowcount
         except mariadb.Error as e:
-            logger.error(f"Error while trying to update the transaction {message} to state {state}: {e}")
+            logger.error("Error while trying to update the transaction %s to state %s: %s", message, state, e)
             raise e
 
     def get_state(self, message: int) -> Optional[bool]:
-        if self.con is None or not self.con.open:
-            self.try_connect()
         try:
-            self.cursor.execute(
-                "SELECT msgID, t_state FROM messages WHERE messages.msgID=?;",
-                (message,))
-            self.con.commit()
-            res = self.cursor.fetchone()
-            if res is None:
-                return None
-            (msgID, state) = res
-            return state
+            with self.get_connection() as con:
+                cursor = con.cursor()
+                cursor.execute(
+                    "SELECT msgID, t_state FROM messages WHERE messages.msgID=?;",
+                    (message,))
+                con.commit()
+                res = cursor.fetchone()
+                if res is None:
+                    return None
+                (msgID, state) = res
+                return state
         except mariadb.Error as e:
-            logger.error(f"Error while trying to get state of a transaction: {e}")
+            logger.error("Error while trying to get state of a transaction: %s", e)
             raise e
 
     def get_owner(self, message: int) -> Optional[Tuple[int, bool]]:
-        if self.con is None or not self.con.open:
-            self.try_connect()
         try:
-            self.cursor.execute(
-                "SELECT userID, verified FROM messages WHERE msgID=?;",
-                (message,))
-            res = self.cursor.fetchone()
-            if res is None:
-                return None
-            (user, verified) = res
-            verified = verified == 1
-            return user, verified
+            with self.get_connection() as con:
+                cursor = con.cursor()
+                cursor.execute(
+                    "SELECT userID, verified FROM messages WHERE msgID=?;",
+                    (message,))
+                res = cursor.fetchone()
+                if res is None:
+                    return None
+                (user, verified) = res
+                verified = verified == 1
+                return user, verified
         except mariadb.Error as e:
-            logger.error(f"Error while trying to get a transaction: {e}")
+            logger.error("Error while trying to get a transaction: %s", e)
             raise e
 
     def set_verification(self, message: int, verified: Union[bool, int]) -> int:
-        if self.con is None or not self.con.open:
-            self.try_connect()
         try:
-            self.cursor.execute(
-                "UPDATE messages SET verified = ? WHERE messages.msgID=?;",
-                (verified, message))
-            self.con.commit()
-            return self.cursor.rowcount
+            with self.get_connection() as con:
+                cursor = con.cursor()
+                cursor.execute(
+                    "UPDATE messages SET verified = ? WHERE messages.msgID=?;",
+                    (verified, message))
+                con.commit()
+                return cursor.rowcount
         except mariadb.Error as e:
-            logger.error(f"Error while trying to update the transaction {message} to {verified}: {e}")
+            logger.error("Error while trying to update the transaction %s to %s: %s", message, verified, e)
+            raise e
+
+    def set_verification_many(self, messages: List[int], verified: Union[bool, int]) -> int:
+        if len(messages) == 0:
+            return 0
+        try:
+            with self.get_connection() as con:
+                cursor = con.cursor()
+                cursor.executemany(
+                    "UPDATE messages SET verified = ? WHERE messages.msgID=?;",
+                    [(verified, m) for m in messages])
+                con.commit()
+                return cursor.rowcount
+        except mariadb.Error as e:
+            logger.error("Error while trying to update %s transactions to %s: %s", len(messages), verified, e)
             raise e
 
     def is_unverified_transaction(self, message: int) -> Optional[bool]:
-        if self.con is None or not self.con.open:
-            self.try_connect()
         try:
-            self.cursor.execute(
-                "SELECT msgID, verified FROM messages WHERE messages.msgID=?;",
-                (message,))
-            self.con.commit()
-            res = self.cursor.fetchone()
-            if res is None:
-                return None
-            (msgID, verified) = res
-            return verified == b'\x00'
+            with self.get_connection() as con:
+                cursor = con.cursor()
+                cursor.execute(
+                    "SELECT msgID, verified FROM messages WHERE messages.msgID=?;",
+                    (message,))
+                con.commit()
+                res = cursor.fetchone()
+                if res is None:
+                    return None
+                (msgID, verified) = res
+                return verified == b'\x00'
         except mariadb.Error as e:
-            logger.error(f"Error while trying to check a transaction: {e}")
+            logger.error("Error while trying to check a transaction: %s", e)
             raise e
 
     def get_unverified(self, include_user: bool = False) -> Union[List[int], List[Tuple[int, int]]]:
-        if self.con is None or not self.con.open:
-            self.try_connect()
         try:
-            res = []
-            if include_user:
-                self.cursor.execute(
-                    "SELECT msgID, userID FROM messages WHERE verified=b'0';")
-                for (msg, user) in self.cursor:
-                    res.append((msg, user))
-            else:
-                self.cursor.execute(
-                    "SELECT msgID FROM messages WHERE verified=b'0';")
-                for (msg,) in self.cursor:
-                    res.append(msg)
-            return res
+            with self.get_connection() as con:
+                cursor = con.cursor()
+                res = []
+                if include_user:
+                    cursor.execute(
+                        "SELECT msgID, userID FROM messages WHERE verified=b'0';")
+                    for (msg, user) in cursor:
+                        res.append((msg, user))
+                else:
+                    cursor.execute(
+                        "SELECT msgID FROM messages WHERE verified=b'0';")
+                    for (msg,) in cursor:
+                        res.append(msg)
+                return res
         except mariadb.Error as e:
-            logger.error(f"Error while trying to get all unverified transactions: {e}")
+            logger.error("Error while trying to get all unverified transactions: %s", e)
             raise e
 
     def set_ocr_verification(self, message: int, verified: Union[bool, int]) -> int:
         if type(verified) == bool:
             verified = 1 if verified else 0
-        if self.con is None or not self.con.open:
-            self.try_connect()
         try:
-            self.cursor.execute(
-                "UPDATE messages SET ocr_verified = ? WHERE messages.msgID=?;",
-                (verified, message))
-            self.con.commit()
-            return self.cursor.rowcount
+            with self.get_connection() as con:
+                cursor = con.cursor()
+                cursor.execute(
+                    "UPDATE messages SET ocr_verified = ? WHERE messages.msgID=?;",
+                    (verified, message))
+                con.commit()
+                return cursor.rowcount
         except mariadb.Error as e:
-            logger.error(f"Error while trying to update the transaction {message} to ocr_verified {verified}: {e}")
+            logger.error("Error while trying to update the transaction %s to ocr_verified %s: %s", message, verified, e)
             raise e
 
     def get_ocr_verification(self, message: int) -> Optional[bool]:
-        if self.con is None or not self.con.open:
-            self.try_connect()
         try:
-            self.cursor.execute(
-                "SELECT msgID, ocr_verified FROM messages WHERE messages.msgID=?;",
-                (message,))
-            self.con.commit()
-            res = self.cursor.fetchone()
-            if res is None:
-                return None
-            (msgID, verified) = res
-            return verified == b'\x01'
+            with self.get_connection() as con:
+                cursor = con.cursor()
+                cursor.execute(
+                    "SELECT msgID, ocr_verified FROM messages WHERE messages.msgID=?;",
+                    (message,))
+                con.commit()
+                res = cursor.fetchone()
+                if res is None:
+                    return None
+                (msgID, verified) = res
+                return verified == b'\x01'
         except mariadb.Error as e:
-            logger.error(f"Error while trying to check a transaction: {e}")
+            logger.error("Error while trying to check a transaction: %s", e)
             raise e
 
     def delete(self, message: int) -> None:
-        if self.con is None or not self.con.open:
-            self.try_connect()
         try:
-            self.cursor.execute(
-                "DELETE FROM messages WHERE messages.msgID=?",
-                (message,))
-            self.con.commit()
-            affected = self.cursor.rowcount
-            if not affected == 1:
-                logger.warning(f"Deletion of message {message} affected {affected} rows, expected was 1 row")
-            else:
-                # logger.info(f"Deleted message {message}, affected {affected} rows")
-                pass
+            with self.get_connection() as con:
+                cursor = con.cursor()
+                cursor.execute(
+                    "DELETE FROM messages WHERE messages.msgID=?",
+                    (message,))
+                con.commit()
+                affected = cursor.rowcount
+                if not affected == 1:
+                    logger.warning("Deletion of message %s affected %s rows, expected was 1 row", message, affected)
+                else:
+                    # logger.info(f"Deleted message {message}, affected {affected} rows")
+                    pass
+        except mariadb.Error as e:
+            logger.error("Error while trying to delete a transaction: %s", e)
+            raise e
+
+    def delete_many(self, messages: List[int]) -> None:
+        if len(messages) == 0:
+            return
+        try:
+            with self.get_connection() as con:
+                cursor = con.cursor()
+                cursor.executemany(
+                    "DELETE FROM messages WHERE messages.msgID=?",
+                    [(m,) for m in messages])
+                con.commit()
+                affected = cursor.rowcount
+                if not affected == len(messages):
+                    logger.warning("Deletion of %s messages affected %s rows", len(messages), affected)
         except mariadb.Error as e:
-            logger.error(f"Error while trying to delete a transaction: {e}")
+            logger.error("Error while trying to delete %s transactions: %s", len(messages), e)
             raise e
 
     def add_shortcut(self, msg_id: int, channel_id: int) -> None:
-        if self.con is None or not self.con.open:
-            self.try_connect()
         try:
-            self.cursor.execute(
-                "INSERT INTO shortcuts (msgID, channelID) VALUES (?, ?);",
-                (msg_id, channel_id))
-            self.con.commit()
-            affected = self.cursor.rowcount
-            if not affected == 1:
-                logger.warning(f"Insertion of shortcut message {msg_id} affected {affected} rows, expected was 1 row")
-            else:
-                logger.info(f"Inserted shortcut message {msg_id}, affected {affected} rows")
+            with self.get_connection() as con:
+                cursor = con.cursor()
+                cursor.execute(
+                    "INSERT INTO shortcuts (msgID, channelID) VALUES (?, ?);",
+                    (msg_id, channel_id))
+                con.commit()
+                affected = cursor.rowcount
+                if not affected == 1:
+                    logger.warning("Insertion of shortcut message %s affected %s rows, expected was 1 row",
+                                   msg_id, affected)
+                else:
+                    logger.info("Inserted shortcut message %s, affected %s rows", msg_id, affected)
         except mariadb.Error as e:
-            logger.error(f"Error while trying to insert a shortcut message {msg_id}: {e}")
+            logger.error("Error while trying to insert a shortcut message %s: %s", msg_id, e)
             raise e
 
     def get_shortcuts(self) -> List[Tuple[int, int]]:
-        if self.con is None or not self.con.open:
-            self.try_connect()
         try:
-            res = []
-            self.cursor.execute(
-                "SELECT msgID, channelID FROM shortcuts;")
-            for (msg, channel) in self.cursor:
-                res.append((msg, channel))
-            return res
+            with self.get_connection() as con:
+                cursor = con.cursor()
+                res = []
+                cursor.execute(
+                    "SELECT msgID, channelID FROM shortcuts;")
+                for (msg, channel) in cursor:
+                    res.append((msg, channel))
+                return res
         except mariadb.Error as e:
-            logger.error(f"Error while trying to get all shortcut messages: {e}")
+            logger.error("Error while trying to get all shortcut messages: %s", e)
             raise e
 
     def delete_shortcut(self, message: int) -> None:
-        if self.con is None or not self.con.open:
-            self.try_connect()
         try:
-            self.cursor.execute(
-                "DELETE FROM shortcuts WHERE shortcuts.msgID=?",
-                (message,))
-            self.con.commit()
-            affected = self.cursor.rowcount
-            if not affected == 1:
-                logger.warning(f"Deletion of shortcut message {message} affected {affected} rows, expected was 1 row")
-            else:
-                logger.info(f"Deleted shortcut message {message}, affected {affected} rows")
+            with self.get_connection() as con:
+                cursor = con.cursor()
+                cursor.execute(
+                    "DELETE FROM shortcuts WHERE shortcuts.msgID=?",
+                    (message,))
+                con.commit()
+                affected = cursor.rowcount
+                if not affected == 1:
+                    logger.warning("Deletion of shortcut message %s affected %s rows, expected was 1 row",
+                                   message, affected)
+                else:
+                    logger.info("Deleted shortcut message %s, affected %s rows", message, affected)
         except mariadb.Error as e:
-            logger.error(f"Error while trying to delete a shortcut message: {e}")
+            logger.error("Error while trying to delete a shortcut message: %s", e)
             raise e
@@ -6,11 +6,10 @@ import asyncio
 import logging
 import time
 from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Literal
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Literal, Set
 
 import discord
-import pytz
 from discord import SlashCommandGroup, ApplicationContext, User, Embed, Color, option, ButtonStyle, InputTextStyle, \
     Message, PartialEmoji, Interaction
 from discord.ext import commands, tasks
@@ -76,39 +75,38 @@ class ApplicationPlugin(BotPlugin):
         self.apl_loop.start()
         _views = self.config["views"]  # type: List[Dict[str, Any]]
         logger.info("Setting up %s views", len(_views))
-        coros = []
         to_delete = []
-        for raw_view in _views:
-            try:
-                channel = await self.bot.get_or_fetch_channel(raw_view["channel"])
-                message = await channel.fetch_message(raw_view["message"])
-            except discord.HTTPException as e:
-                logger.error("Failed to set up view in channel %s for message %s",
-                             raw_view["channel"], raw_view["message"])
-                utils.log_error(logger=self.logger, error=e, minimal=True)
-                to_delete.append(raw_view)
-                continue
-            view_type = raw_view["type"]
-            if view_type == "TICKET":
-                view = TicketView(self)
-            elif view_type == "APPLY":
-                view = ApplyView(self)
-            else:
-                logger.error("Unknown view type %s for msg %s in channel %s",
-                             view_type, raw_view["message"], raw_view["channel"])
-                continue
-            self.views.append(view)
-
-            async def _edit_msg(msg: Message, _view: AutoDisableView):
-                logger.info("Refreshing view for msg %s", msg.id)
-                msg = await msg.edit(view=_view)
-                if _view.message is None:
-                    _view.message = msg
-            coros.append(_edit_msg(message, view))
+        # The views are independent of each other, their messages are fetched and edited concurrently
+        views = await asyncio.gather(*[self._setup_view(raw_view, to_delete) for raw_view in _views])
+        self.views.extend(view for view in views if view is not None)
         for v in to_delete:
             _views.remove(v)
-        self.config.save_config(self.config_path)
-        await asyncio.gather(*coros)
+        await self.config.save_config_async(self.config_path)
+
+    async def _setup_view(self, raw_view: Dict[str, Any], to_delete: List[Dict[str, Any]]) -> AutoDisableView | None:
+        try:
+            channel = await self.bot.get_or_fetch_channel(raw_view["channel"])
+            message = await channel.fetch_message(raw_view["message"])
+        except discord.HTTPException as e:
+            logger.error("Failed to set up view in channel %s for message %s",
+                         raw_view["channel"], raw_view["message"])
+            utils.log_error(logger=self.logger, error=e, minimal=True)
+            to_delete.append(raw_view)
+            return None
+        view_type = raw_view["type"]
+        if view_type == "TICKET":
+            view = TicketView(self)
+        elif view_type == "APPLY":
+            view = ApplyView(self)
+        else:
+            logger.error("Unknown view type %s for msg %s in channel %s",
+                         view_type, raw_view["message"], raw_view["channel"])
+            return None
+        logger.info("Refreshing view for msg %s", message.id)
+        message = await message.edit(view=view)
+        if view.message is None:
+            view.message = message
+        return view
 
     async def on_disable(self):
         self.apl_loop.cancel()
@@ -121,18 +119,18 @@ class ApplicationPlugin(BotPlugin):
 
     @tasks.loop(minutes=5)
     async def apl_loop(self):
-        delete_sessions = []
+        delete_sessions = set()  # type: Set[ApplicationSession]
         try:
             c_time = datetime.now()
             max_time = timedelta(minutes=15)
             for session in self.active_sessions:
                 if session.completed:
-                    delete_sessions.append(session)
+                    delete_sessions.add(session)
                     continue
                 if (c_time - session.last_action) > max_time:
                     logger.info("Application session for %s:%s timed out on question %s",
                                 session.user.name, session.user.id, len(session.questions_asked))
-                    delete_sessions.append(session)
+                    delete_sessions.add(session)
                     await asyncio.gather(
                         session.message.edit(view=None),
                         session.user.send(
@@ -144,9 +142,9 @@ class ApplicationPlugin(BotPlugin):
                     )
         except Exception as e:
             utils.log_error(logger, e, location="apl_loop")
-        for session in delete_sessions:
-            if session in self.active_sessions:
-                self.active_sessions.remove(session)
+        if len(delete_sessions) > 0:
+            # Rebuilding the list in one pass instead of removing the sessions one by one
+            self.active_sessions[:] = [s for s in self.active_sessions if s not in delete_sessions]
 
     @apl_loop.error
     async def update_message_error(self, error):
@@ -204,7 +202,7 @@ class ApplicationSession(object):
 
     def build_result_embed(self, time_outed=False, reduced=False):
         created_time = self.user.created_at
-        age = datetime.now(pytz.UTC) - created_time
+        age = datetime.now(timezone.utc) - created_time
         emb_desc = f"Nutzer-ID: `{self.user.id}`\n"
         if not reduced:
             emb_desc += f"Account Alter: `{age}`\n" \
@@ -390,7 +388,7 @@ class ApplicationCommands(commands.Cog):
             "message": msg.id,
             "type": view_type
         })
-        self.plugin.config.save_config(self.plugin.config_path)
+        await self.plugin.config.save_config_async(self.plugin.config_path)
         logger.info("User %s:%s added view %s to message %s in %s",
                     ctx.user.name, ctx.user.id, view_type, msg.id, msg.channel.id)
 
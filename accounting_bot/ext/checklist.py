@@ -17,7 +17,7 @@ import discord
 from dateutil import parser
 from dateutil.relativedelta import relativedelta
 from discord import SlashCommandGroup, ApplicationContext, Embed, Colour, Message, Interaction, PartialEmoji
-from discord.ext import commands
+from discord.ext import commands, tasks
 
 from accounting_bot import utils
 from accounting_bot.exceptions import UnexpectedStateException, InputException, NoPermissionException
@@ -408,7 +408,7 @@ class CheckListView(AutoDisableView):
             ModalForm(title="New Task", ignore_timeout=True)
             .add_field(label="Task Name", placeholder="Enter the name of the task here")
             .add_field(label="Time", value=datetime.now().isoformat(sep=" ", timespec="minutes"))
-            .open_form(ctx.response)
+            .open_form(ctx.response, ctx.user)
         )
         if modal.is_timeout():
             return
@@ -506,7 +506,7 @@ class EditTaskView(NumPadView):
                     await
                     ModalForm(title="Change time", send_response=True, ignore_timeout=True)
                     .add_field(label="Time", value=task.time.isoformat(sep=" ", timespec="minutes"))
-                    .open_form(ctx.response)
+                    .open_form(ctx.response, ctx.user)
                 ).retrieve_result()
                 task_time = parse_time_str(raw_time)
                 if not re.search(hour_pattern, raw_time):
@@ -522,7 +522,7 @@ class EditTaskView(NumPadView):
                     await
                     ModalForm(title="Change delay", send_response=True, ignore_timeout=True)
                     .add_field(label="Delay", placeholder="[N]ever, [D]aily, [W]eekly, [M]onthly")
-                    .open_form(ctx.response)
+                    .open_form(ctx.response, ctx.user)
                 ).retrieve_result()
                 if task_delay is None:
                     return
@@ -532,7 +532,7 @@ class EditTaskView(NumPadView):
                     await
                     ModalForm(title="Change name", send_response=True, ignore_timeout=True)
                     .add_field(label="Name", placeholder="Enter new name here", value=task.name)
-                    .open_form(ctx.response)
+                    .open_form(ctx.response, ctx.user)
                 ).retrieve_result()
                 if task_name is None:
                     return
@@ -567,7 +567,7 @@ class CheckListCommands(commands.Cog):
     def cog_unload(self) -> None:
         self.update_messages.cancel()
 
-    @discord.ext.tasks.loop(hours=4)
+    @tasks.loop(hours=4)
     async def update_messages(self):
         if self.last_refresh is not None and datetime.now() - self.last_refresh < timedelta(minutes=10):
             logger.warning("Minimum refresh delay is 10 minutes for update loop")
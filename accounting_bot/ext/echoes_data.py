@@ -306,7 +306,7 @@ class BlueprintInfoView(AutoDisableView):
             return
 
         from gspread.utils import ValueRenderOption
-        model = ModalForm(title="Insert data into Google Sheet", send_response=False)
+        model = ModalForm(title="Insert data into Google Sheet", send_response=ModalForm.DEFER_VISIBLE)
         model.add_field(
             label="Sheet Name",
             placeholder="Name of the sheet to insert the data into",
@@ -316,10 +316,9 @@ class BlueprintInfoView(AutoDisableView):
             placeholder="Row to insert the data into",
         )
         # noinspection PyTypeChecker
-        await model.open_form(interaction.response)
+        await model.open_form(interaction.response, interaction.user)
         result = model.retrieve_results()
         interaction = model.get_interaction()
-        await interaction.response.defer(ephemeral=True)
         sheet_name = result["Sheet Name"]
         start_row = int(result["Row"].strip())
         sheet_plugin: SheetPlugin = self.plugin.bot.get_plugin("SheetMain")
@@ -216,7 +216,7 @@ class EmbedBuilderView(AutoDisableView):
                        style=InputTextStyle.paragraph, value=self.builder.description, max_length=4000)
             .add_field(label="Color", placeholder="Color hex code",
                        value="#%02x%02x%02x" % self.builder.color.to_rgb())
-            .open_form(ctx.response)
+            .open_form(ctx.response, ctx.user)
         )
         if form.is_timeout():
             return
@@ -234,7 +234,7 @@ class EmbedBuilderView(AutoDisableView):
             .add_field("Footer Icon URL", placeholder="https://...", required=False, value=self.builder.footer_icon)
             .add_field("Image", placeholder="https://...", required=False, value=self.builder.image)
             .add_field("Thumbnail", placeholder="https://...", required=False, value=self.builder.thumbnail)
-            .open_form(ctx.response)
+            .open_form(ctx.response, ctx.user)
         )
         if form.is_timeout():
             return
@@ -250,7 +250,7 @@ class EmbedBuilderView(AutoDisableView):
             ModalForm(title="Edit settings", send_response=True, ignore_timeout=True)
             .add_field(label="Embed name", placeholder="The name of the embed", value=self.builder.embed_name)
             .add_field(label="File name", placeholder="The description of the embed", value=self.builder.file_name)
-            .open_form(ctx.response)
+            .open_form(ctx.response, ctx.user)
         )
         if form.is_timeout():
             return
@@ -291,7 +291,7 @@ class EmbedBuilderView(AutoDisableView):
             .add_field(label="Content", placeholder="The content of the field", style=InputTextStyle.paragraph,
                        max_length=1024)
             .add_field(label="Inline", placeholder="[Y]es or [N]o", value="No", max_length=3)
-            .open_form(ctx.response)
+            .open_form(ctx.response, ctx.user)
         )
         if form.is_timeout():
             return
@@ -321,7 +321,7 @@ class EmbedBuilderView(AutoDisableView):
             .add_field(label="Content", placeholder="The content of the field", value=field.value,
                        style=InputTextStyle.paragraph, max_length=1024)
             .add_field(label="Inline", placeholder="[Y]es or [N]o", value="Yes" if field.inline else "No", max_length=3)
-            .open_form(res)
+            .open_form(res, ctx.user)
         )
         if form.is_timeout():
             return
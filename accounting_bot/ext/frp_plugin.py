@@ -9,7 +9,7 @@ import logging
 import re
 import time
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Tuple, Optional
 
 import discord
 from discord import Message, User, Embed, Color, Interaction, ApplicationContext, RawReactionActionEvent
@@ -51,47 +51,55 @@ class FrpPlugin(BotPlugin):
         logger.info("Loaded %s frp messages from config", len(self.frp_messages))
 
     async def on_enable(self):
-        to_delete = []
-        for msg_id, chan_id in self.frp_messages.items():
-            channel = await self.bot.get_or_fetch_channel(chan_id)
-            if channel is None:
-                logger.info("Channel %s for message %s not found, deleting it", chan_id, msg_id)
-                to_delete.append((msg_id, chan_id))
-                continue
-            p_msg = channel.get_partial_message(msg_id)
-            frp_state = FRPsState(self)
-            view = FRPsView(frp_state)
-            try:
-                msg = await p_msg.edit(view=view)
-                if view.message is None:
-                    view.message = msg
-            except discord.NotFound:
-                logger.info("Message %s not found in channel %s, deleting it", msg_id, chan_id)
-                to_delete.append((msg_id, chan_id))
-                continue
-            except discord.Forbidden as e:
-                logger.error("Message %s in channel %s can't be edited: %s", msg_id, chan_id, e)
-                continue
-            self.frp_states.append(frp_state)
+        to_delete = []  # type: List[Tuple[int, int]]
+        # The menus are independent of each other, their channels and messages are fetched concurrently
+        states = await asyncio.gather(*[
+            self._setup_menu(msg_id, chan_id, to_delete) for msg_id, chan_id in self.frp_messages.items()
+        ])
+        self.frp_states.extend(state for state in states if state is not None)
         funcs = []
         for frp_state in self.frp_states:
             funcs.append(frp_state.view.refresh_msg())
         logger.info("Refreshing %s frp messages", len(funcs))
         await asyncio.gather(*funcs)
 
+    async def _setup_menu(self, msg_id: int, chan_id: int, to_delete: List[Tuple[int, int]]) -> Optional["FRPsState"]:
+        channel = await self.bot.get_or_fetch_channel(chan_id)
+        if channel is None:
+            logger.info("Channel %s for message %s not found, deleting it", chan_id, msg_id)
+            to_delete.append((msg_id, chan_id))
+            return None
+        p_msg = channel.get_partial_message(msg_id)
+        frp_state = FRPsState(self)
+        view = FRPsView(frp_state)
+        try:
+            msg = await p_msg.edit(view=view)
+            if view.message is None:
+                view.message = msg
+        except discord.NotFound:
+            logger.info("Message %s not found in channel %s, deleting it", msg_id, chan_id)
+            to_delete.append((msg_id, chan_id))
+            return None
+        except discord.Forbidden as e:
+            logger.error("Message %s in channel %s can't be edited: %s", msg_id, chan_id, e)
+            return None
+        return frp_state
+
     async def on_disable(self):
-        for state in self.frp_states:
-            await state.inform_users(msg="Der Bot wurde gestoppt, es wird keine Erinnerungen mehr geben")
+        await asyncio.gather(*[
+            state.inform_users(msg="Der Bot wurde gestoppt, es wird keine Erinnerungen mehr geben")
+            for state in self.frp_states
+        ])
         self.frp_states.clear()
 
     def on_unload(self):
         self.frp_messages.clear()
 
     async def update_messages(self):
-        funcs = []
-        for frp in self.frp_states:
-            funcs.append(frp.tick())
-        await asyncio.gather(*funcs)
+        # Idle menus have no timers or reminders, there is nothing to do for them
+        funcs = [frp.tick() for frp in self.frp_states if frp.state != FRPsState.State.idle]
+        if len(funcs) > 0:
+            await asyncio.gather(*funcs)
 
 
 class FrpCommands(commands.Cog):
@@ -118,33 +126,36 @@ class FrpCommands(commands.Cog):
         self.plugin.frp_states.append(state)
         self.plugin.config["channel_ids"].append(m.channel.id)
         self.plugin.config["msg_ids"].append(m.id)
-        self.plugin.bot.save_config()
+        await self.plugin.bot.save_config_async()
         await ctx.followup.send("Neues Menü gesendet.")
 
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, event: RawReactionActionEvent):
-        if event.emoji.name == "🗑️":
-            channel = await self.plugin.bot.get_or_fetch_channel(event.channel_id)
-            msg = await channel.fetch_message(event.message_id)
-            if msg.author != self.plugin.bot.user:
-                return
-            if event.user_id == self.plugin.bot.user.id:
-                return
-            if msg.reference is None:
-                return
-            is_ping = False
-            state = None
-            for state in self.plugin.frp_states:
-                if state.view.message.id == msg.reference.message_id:
-                    is_ping = True
-                    break
-            if not is_ping:
-                return
-            await msg.delete(reason=f"Deleted by {event.user_id}")
-            if state.state > FRPsState.State.idle:
-                await state.inform_users(f"Ping wurde von {event.user_id} gelöscht")
-            logger.warning("Ping in channel %s for menu %s was deleted by %s",
-                           event.channel_id, msg.reference.message_id, event.user_id)
+        bot_user_id = self.plugin.bot.user.id
+        if event.user_id == bot_user_id or event.emoji.name != "🗑️":
+            return
+        # Pings are replies to a menu, skip reactions outside the menu channels before fetching the message
+        if not any(state.view.message.channel.id == event.channel_id for state in self.plugin.frp_states):
+            return
+        channel = await self.plugin.bot.get_or_fetch_channel(event.channel_id)
+        msg = await channel.fetch_message(event.message_id)
+        if msg.author.id != bot_user_id:
+            return
+        if msg.reference is None:
+            return
+        is_ping = False
+        state = None
+        for state in self.plugin.frp_states:
+            if state.view.message.id == msg.reference.message_id:
+                is_ping = True
+                break
+        if not is_ping:
+            return
+        await msg.delete(reason=f"Deleted by {event.user_id}")
+        if state.state > FRPsState.State.idle:
+            await state.inform_users(f"Ping wurde von {event.user_id} gelöscht")
+        logger.warning("Ping in channel %s for menu %s was deleted by %s",
+                       event.channel_id, msg.reference.message_id, event.user_id)
 
     @tasks.loop(minutes=1)
     async def update_messages(self):
@@ -229,13 +240,20 @@ class FRPsState(object):
         )
 
     async def inform_users(self, msg: str):
+        async def _send_to_id(user_id: int):
+            user = await self.plugin.bot.get_or_fetch_user(user_id)
+            await user.send(msg)
+
         routines = []
         if self.user is not None:
-            user = await self.plugin.bot.get_or_fetch_user(self.user)
-            routines.append(user.send(msg))
+            routines.append(_send_to_id(self.user))
         for user in self.reminder_list:
             routines.append(user.send(msg))
-        await asyncio.gather(*routines)
+        # A user with closed DMs should not prevent the other users from getting informed
+        results = await asyncio.gather(*routines, return_exceptions=True)
+        for res in results:
+            if isinstance(res, Exception):
+                logger.warning("Failed to send FRP notification: %s", res)
 
 
 # noinspection PyUnusedLocal
@@ -7,8 +7,8 @@ import logging
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Tuple, Union, Optional, Set
 
+import aiohttp
 import discord
-import requests
 from discord import NotFound, Forbidden, Thread, Message, Embed, Color, Cog, ApplicationContext, option
 from discord.abc import GuildChannel, PrivateChannel
 from discord.ext import tasks, commands
@@ -17,7 +17,7 @@ from accounting_bot.exceptions import KillmailException
 from accounting_bot.main_bot import BotPlugin, PluginWrapper
 from accounting_bot.universe import data_utils
 from accounting_bot.universe.models import MobiKillmail
-from accounting_bot.utils import wrap_async, admin_only
+from accounting_bot.utils import admin_only
 
 if TYPE_CHECKING:
     from accounting_bot.main_bot import AccountingBot
@@ -38,13 +38,10 @@ CONFIG_TREE = {
 }
 
 
-@wrap_async
-def fetch_csv(page: int, corp_tag: str):
-    response = requests.request(
-        method="GET",
-        url=API_ENDPOINT_KILLS.format(page=page, killer_corp=corp_tag),
-        headers={"accept": "text/csv"})
-    return response.content.decode("utf-8")
+async def fetch_csv(session: aiohttp.ClientSession, page: int, corp_tag: str) -> str:
+    async with session.get(API_ENDPOINT_KILLS.format(page=page, killer_corp=corp_tag),
+                           headers={"accept": "text/csv"}) as response:
+        return await response.text(encoding="utf-8")
 
 
 class KillboardPlugin(BotPlugin):
@@ -71,33 +68,35 @@ class KillboardPlugin(BotPlugin):
                 pass
             except Forbidden:
                 logger.error("Failed to access killboard in channel %s message %s: No access", c, m)
-        self.save_killboards()
+        await self.save_killboards()
         logger.info("Found %s killboards", len(self.killboards))
         self.cog.update_messages.start()
 
-    def save_killboards(self):
+    async def save_killboards(self):
         self.config["killboards"].clear()
         for channel, msg in self.killboards:
             self.config["killboards"].append((channel.id, msg.id))
-        self.bot.save_config()
+        await self.bot.save_config_async()
 
     async def refresh_kill_db(self):
         only_first_page = self.config["only_first_page"]
         replace_tag = self.config["replace_tag"]
-        for corp_tag in self.config["corp_tags"]:
-            has_data = True
-            page = 1
-            while has_data:
-                logger.info("Fetching killmail page %s for corp %s", page, corp_tag)
-                csv = await fetch_csv(page=page, corp_tag=corp_tag)
-                if len(csv) < 10:
-                    has_data = False
-                page += 1
-                await data_utils.save_mobi_csv(csv, replace_tag=replace_tag)
-                if page > 10:
-                    raise KillmailException(f"Reached page 11 for corp {corp_tag}")
-                if only_first_page:
-                    break
+        # One session for all pages, so the connection to the API can be reused
+        async with aiohttp.ClientSession() as session:
+            for corp_tag in self.config["corp_tags"]:
+                has_data = True
+                page = 1
+                while has_data:
+                    logger.info("Fetching killmail page %s for corp %s", page, corp_tag)
+                    csv = await fetch_csv(session, page=page, corp_tag=corp_tag)
+                    if len(csv) < 10:
+                        has_data = False
+                    page += 1
+                    await data_utils.save_mobi_csv(csv, replace_tag=replace_tag)
+                    if page > 10:
+                        raise KillmailException(f"Reached page 11 for corp {corp_tag}")
+                    if only_first_page:
+                        break
 
     async def build_killboard_embed(self):
         data = await data_utils.get_killboard_data(self.config["corp_tag"])
@@ -153,7 +152,7 @@ class KillboardCog(Cog):
         if msg_id is None:
             msg = await ctx.channel.send(embed=embed)
             self.plugin.killboards.add((msg.channel, msg))
-            self.plugin.save_killboards()
+            await self.plugin.save_killboards()
             await ctx.followup.send("Created a new killboard")
             return
         msg = await ctx.channel.fetch_message(msg_id)
@@ -161,5 +160,5 @@ class KillboardCog(Cog):
         res = next(filter(lambda k: k[1].id == msg_id, self.plugin.killboards), None)
         if res is None:
             self.plugin.killboards.add((msg.channel, msg))
-            self.plugin.save_killboards()
+            await self.plugin.save_killboards()
         await ctx.followup.send(f"Added a killboard to message {msg.jump_url}")
@@ -75,33 +75,36 @@ class MembersPlugin(BotPlugin):
         self._data_provider = None  # type: DataChain | None
         self._save_data_provider = None  # type: DataChain | None
         self._is_member_func = None  # type: Callable[[Union[User, discord.Member]], Awaitable[bool]] | None
+        self.main_guild = None  # type: int | None
+        self.user_role = None  # type: int | None
 
     async def _default_member_func(self, user: Union[User, discord.Member]) -> bool:
-        if self.config["user_role"] is None:
+        if self.user_role is None:
             return False
         if isinstance(user, discord.Member):
             # user = user  # type: discord.Member
-            if user.guild.id == self.config["main_guild"]:
-                return user.get_role(self.config["user_role"]) is not None
+            if user.guild.id == self.main_guild:
+                return user.get_role(self.user_role) is not None
             else:
                 user = await self.bot.get_or_fetch_user(user.id)
         if isinstance(user, User):
             # user = user  # type: User
-            if self.config["main_guild"] is None:
+            if self.main_guild is None:
                 logger.error("main_guild is not set inside the config members.main_guild")
                 return False
-            guild = self.bot.get_guild(self.config["main_guild"])
+            guild = self.bot.get_guild(self.main_guild)
             if guild is None:
-                guild = await self.bot.fetch_guild(self.config["main_guild"])
+                guild = await self.bot.fetch_guild(self.main_guild)
             if guild is None:
-                logger.error("Guild with id %s not found", self.config["main_guild"])
+                logger.error("Guild with id %s not found", self.main_guild)
                 return False
             member = guild.get_member(user.id)
             if member is None:
-                member = guild.fetch_member(user.id)
-            if member is None:
-                return False
-            return member.get_role(self.config["user_role"]) is not None
+                try:
+                    member = await guild.fetch_member(user.id)
+                except discord.NotFound:
+                    return False
+            return member.get_role(self.user_role) is not None
         return False
 
     async def _execute_chain(self):
@@ -138,10 +141,15 @@ class MembersPlugin(BotPlugin):
 
     def on_load(self):
         self.register_cog(MembersCommands(self))
-        if self.config["user_role"] is not None:
+        self.on_config_reload()
+        if self.user_role is not None:
             self._is_member_func = self._default_member_func
             logger.info("Using config with user_role for member verification, guild %s, role %s",
-                        self.config["main_guild"], self.config["user_role"])
+                        self.main_guild, self.user_role)
+
+    def on_config_reload(self):
+        self.main_guild = self.config["main_guild"]
+        self.user_role = self.config["user_role"]
 
     async def on_enable(self):
         await self._execute_chain()
@@ -266,6 +274,19 @@ class MembersPlugin(BotPlugin):
     async def save_user_list(self):
         await self._execute_save_chain()
 
+    async def get_guild_members(self, guild: discord.Guild) -> List[discord.Member]:
+        """
+        Returns all members of a guild. The member list gets requested once via the gateway (chunking) and is kept in
+        the cache afterward, so repeated calls won't have to page through the REST api.
+
+        :param guild: The guild
+        :return: The list of all members
+        """
+        if not guild.chunked:
+            logger.info("Requesting member chunks for guild %s:%s", guild.name, guild.id)
+            await guild.chunk(cache=True)
+        return guild.members
+
 
 def main_char_autocomplete(self: AutocompleteContext):
     # noinspection PyTypeChecker
@@ -449,11 +470,8 @@ class MembersCommands(commands.Cog):
     @guild_only()
     async def find_unregistered_users(self, ctx: ApplicationContext, role: Role, silent: bool):
         await ctx.defer(ephemeral=silent)
-        users = await ctx.guild \
-            .fetch_members() \
-            .filter(lambda m: m.get_role(role.id) is not None) \
-            .map(lambda m: (m.nick if m.nick is not None else m.name, m)) \
-            .flatten()
+        await self.plugin.get_guild_members(ctx.guild)
+        users = [(m.nick if m.nick is not None else m.name, m) for m in role.members]
         unreg_users = []
         no_rank = []
         for name, user in users:  # type: str, discord.Member
@@ -485,10 +503,7 @@ class MembersCommands(commands.Cog):
     @guild_only()
     async def find_missing_players(self, ctx: ApplicationContext, role: Role, silent: bool):
         await ctx.defer(ephemeral=silent)
-        users = dict(await ctx.guild
-                     .fetch_members()
-                     .map(lambda m: (m.id, m))
-                     .flatten())  # type: Dict[int, discord.Member]
+        users = {m.id: m for m in await self.plugin.get_guild_members(ctx.guild)}  # type: Dict[int, discord.Member]
         unreg_users = []
         missing_roles = []
         for player in self.plugin.players:
@@ -535,15 +550,14 @@ class MembersCommands(commands.Cog):
     async def assign_role(self, ctx: ApplicationContext, role: Role, silent: bool):
         modal = (
             await
-            ModalForm(title="Player list", ignore_timeout=True)
+            ModalForm(title="Player list", send_response=ModalForm.DEFER_VISIBLE, ignore_timeout=True)
             .add_field(label="Players", placeholder="Enter the list of players here", style=InputTextStyle.paragraph)
-            .open_form(ctx.response)
+            .open_form(ctx.response, ctx.user)
         )
         if modal.is_timeout():
             return
         res = map(lambda s: s.strip(), modal.retrieve_result().split("\n"))
         interaction = modal.get_interaction()
-        await interaction.response.defer(ephemeral=True)
         players = set()  # type: Set[int]
         missing = []
         for r in res:
@@ -552,7 +566,7 @@ class MembersCommands(commands.Cog):
                 missing.append(r)
                 continue
             players.add(discord_id)
-        members = await ctx.guild.fetch_members().filter(lambda m: m.id in players).flatten()
+        members = [m for m in await self.plugin.get_guild_members(ctx.guild) if m.id in players]
         member_ids = list(map(lambda m: m.id, members))
         for i in players:
             if i not in member_ids:
@@ -6,7 +6,7 @@
 import datetime
 import functools
 import logging
-from typing import List, Any, Dict, TYPE_CHECKING
+from typing import List, Any, Dict, TYPE_CHECKING, FrozenSet
 
 import discord
 from discord import option, ApplicationContext, User, Message
@@ -48,12 +48,17 @@ class BountyPlugin(BotPlugin):
         self.config.load_tree(CONFIG_TREE)
         self.sheet = None  # type: SheetPlugin | None
         self.member_p = None  # type:  MembersPlugin | None
+        self.home_regions = frozenset()  # type: FrozenSet[str]
 
     def on_load(self):
         self.sheet = self.bot.get_plugin("SheetMain")
         self.member_p = self.bot.get_plugin("MembersPlugin")
         self.register_cog(BountyCommands(self))
         self.killmail_channel = self.config["killmail_channel"]
+        self.on_config_reload()
+
+    def on_config_reload(self):
+        self.home_regions = frozenset(self.config["bounty_home_regions"])
 
     async def update_killmails(self, bounties: List[Dict[str, Any]], warnings: List[str] = None, auto_fix=False):
         """
@@ -131,10 +136,10 @@ class BountyPlugin(BotPlugin):
                 logger.info("Bounty data 'type' has changed for %s:%s", kill_id, player)
                 warnings.append(f"Bounty data 'type' has changed for {kill_id}:{player}")
                 updated = True
-            if kill_id is not None and home != (bounty["region"] in self.config["bounty_home_regions"]):
+            if kill_id is not None and home != (bounty["region"] in self.home_regions):
                 batch_changes.append({
                     "range": row[4].address,
-                    "values": [[bounty["region"] in self.config["bounty_home_regions"]]]
+                    "values": [[bounty["region"] in self.home_regions]]
                 })
                 logger.info("Bounty data 'home' has changed for %s:%s", kill_id, player)
                 warnings.append(f"Bounty data 'home' has changed for {kill_id}:{player}")
@@ -160,7 +165,7 @@ class BountyPlugin(BotPlugin):
                     str(bounty["player"]),
                     bounty["value"],
                     bounty["type"] == "T",
-                    bounty["region"] in self.config["bounty_home_regions"]
+                    bounty["region"] in self.home_regions
                 ]]
             })
             num_new += 1
@@ -266,7 +271,7 @@ class BountyCommands(Cog):
         for b in res:
             if b["type"] == "T":
                 factor = self.plugin.config["bounty_tackle"]
-            elif b["region"] in self.plugin.config["bounty_home_regions"]:
+            elif b["region"] in self.plugin.home_regions:
                 factor = self.plugin.config["bounty_home"]
             else:
                 factor = self.plugin.config["bounty_normal"]
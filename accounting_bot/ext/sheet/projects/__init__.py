@@ -12,9 +12,9 @@ import time
 from datetime import datetime
 from difflib import SequenceMatcher
 from typing import Dict, List, Tuple, Callable, TYPE_CHECKING, Optional
+from zoneinfo import ZoneInfo
 
 import discord
-import pytz
 from discord import ApplicationContext, InputTextStyle, Interaction, Option, option, Embed, Colour
 from discord.ext import commands
 from discord.ext.commands import cooldown
@@ -34,6 +34,7 @@ from accounting_bot.utils import string_to_file, list_to_string, AutoDisableView
     online_only
 
 logger = logging.getLogger("ext.project")
+BERLIN_TZ = ZoneInfo("Europe/Berlin")
 # logger.setLevel(logging.DEBUG)
 CONFIG_TREE = {
     "sheet_overview_name": (str, "Ressourcenbedarf Projekte"),
@@ -142,7 +143,7 @@ class ProjectCommands(commands.Cog):
         await self.plugin.find_projects()
         log = await self.plugin.load_projects()
         if sheet_main.lastChanges.year != 1970:
-            res = "Projectlist version: " + sheet_main.lastChanges.astimezone(pytz.timezone("Europe/Berlin")).strftime(
+            res = "Projectlist version: " + sheet_main.lastChanges.astimezone(BERLIN_TZ).strftime(
                 "%d.%m.%Y %H:%M") + "\n"
         else:
             res = "Unknown sheet time\n"
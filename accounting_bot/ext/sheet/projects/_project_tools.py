@@ -48,12 +48,7 @@ async def find_projects(self: "ProjectPlugin"):
         if s.title.startswith("Project"):
             wk_projects.append(s)
             self.wk_project_names.append(s.title)
-    names = ""
-    for n in self.wk_project_names:
-        names += n
-        if self.wk_project_names.index(n) < len(self.wk_project_names) - 1:
-            names += ", "
-    logger.info(f"Found {len(self.wk_project_names)} project sheets: " + names)
+    logger.info("Found %s project sheets: %s", len(self.wk_project_names), ", ".join(self.wk_project_names))
 
 
 async def load_projects(self: "ProjectPlugin") -> [str]:
@@ -98,7 +93,7 @@ async def load_project(self: "ProjectPlugin", project_name: str, log: [str], she
     """
     # if not self.bot.is_online():
     #     raise BotOfflineException()
-    logger.info(f"Loading project {project_name}")
+    logger.info("Loading project %s", project_name)
     log.append(f"Starting processing of project sheet \"{project_name}\"")
     s = await sheet.worksheet(project_name)
 
@@ -109,7 +104,7 @@ async def load_project(self: "ProjectPlugin", project_name: str, log: [str], she
 
     if pending_cell is None:
         log.append(f"  ERROR: Project sheet {project_name} is malformed")
-        logger.warning(f"Project sheet {project_name} is malformed")
+        logger.warning("Project sheet %s is malformed", project_name)
         return
 
     project = Project(project_name)
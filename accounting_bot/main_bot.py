@@ -16,13 +16,13 @@ from datetime import datetime
 from enum import Enum
 from os import PathLike
 from types import ModuleType
-from typing import Dict, Union, List, Optional, Tuple, Any, Callable
+from typing import Dict, Union, List, Optional, Tuple, Any, Callable, FrozenSet
 
 import discord
 from discord import ApplicationContext, ApplicationCommandError, User, Member, Embed, Color, option, Thread, \
     ActivityType, SlashCommandGroup, AutocompleteContext
 from discord.abc import GuildChannel, PrivateChannel
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from accounting_bot import utils, exceptions
 from accounting_bot.config import Config
@@ -34,12 +34,12 @@ from accounting_bot.utils import State, log_error, send_exception, owner_only, c
 
 logger = logging.getLogger("bot.main")
 
-SILENT_EXCEPTIONS = [
+SILENT_EXCEPTIONS = (
     commands.CommandOnCooldown, InputException, discord.CheckFailure, commands.CheckFailure
-]
-LOUD_EXCEPTIONS = [
-    exceptions.UnhandledCheckException
-]
+)
+LOUD_EXCEPTIONS = (
+    exceptions.UnhandledCheckException,
+)
 base_config = {
     "plugins": (list, []),
     "error_log_channel": (int, None),
@@ -91,12 +91,12 @@ class AccountingBot(commands.Bot):
         self.config.load_tree(base_config)
         self.localization = LocalizationHandler()
         self.config_path = config_path
-        self.admins = []  # type: List[int]
+        self.admins = frozenset()  # type: FrozenSet[int]
         self.pycord_handler = pycord_handler
         self.add_cog(BotCommands(self))
-        self.log_loop.start()
         self.shutdown_reason = None  # type: str | None
         self.maintenance_end_time = None  # type: datetime | None
+        self.rich_presence = None  # type: discord.Activity | None
 
         def _get_locale(ctx: commands.Context):
             if isinstance(ctx, ApplicationContext) and ctx.locale is not None:
@@ -121,13 +121,21 @@ class AccountingBot(commands.Bot):
     def is_online(self):
         return self.state.value >= State.online.value
 
-    def load_config(self) -> None:
-        self.config.load_config(self.config_path)
-        self.admins = self.config["admins"]
+    def load_config(self, raw_json: Optional[str] = None) -> None:
+        if raw_json is None:
+            self.config.load_config(self.config_path)
+        else:
+            self.config.load_json(raw_json)
+        self.admins = frozenset(self.config["admins"])
+        # The activity will be rebuilt from the new config on the next on_ready event
+        self.rich_presence = None
 
     def save_config(self) -> None:
         self.config.save_config(self.config_path)
 
+    async def save_config_async(self) -> None:
+        await self.config.save_config_async(self.config_path)
+
     def create_sub_config(self, root_key: str) -> Config:
         return self.config.create_sub_config(root_key)
 
@@ -155,9 +163,14 @@ class AccountingBot(commands.Bot):
             logger.error("Failed to resolve plugin load order, no plugin was loaded")
             utils.log_error(logger, e, location="plugin_loader")
             return
+        # The config is reapplied before every plugin, but the file only has to be read once
+        raw_json = None
+        if os.path.exists(self.config_path):
+            with open(self.config_path, encoding="utf8") as json_file:
+                raw_json = json_file.read()
         for plugin in plugins:
             try:
-                self.load_config()
+                self.load_config(raw_json)
                 plugin.load_plugin(self)
                 self.plugins.append(plugin)
             except PluginLoadException as e:
@@ -168,6 +181,8 @@ class AccountingBot(commands.Bot):
     async def reload_plugin(self, name: str, force=False):
         wrapper = self.get_plugin_wrapper(name)
         await wrapper.reload_plugin(bot=self, force=force)
+        # The cogs of the plugin got re-registered, sync all commands with a single bulk request
+        await self.sync_commands()
 
     async def fetch_owner(self):
         app = await self.application_info()  # type: ignore
@@ -178,7 +193,7 @@ class AccountingBot(commands.Bot):
 
     async def enable_plugins(self):
         self.state = State.starting
-        if self.owner_id is None:
+        if self.owner_id is None and not self.owner_ids:
             await self.fetch_owner()
         for plugin in self.plugins:
             if plugin.state == PluginState.ENABLED:
@@ -217,17 +232,27 @@ class AccountingBot(commands.Bot):
             await wrapper.edit_messages(embed=embed)
 
         await asyncio.sleep(5)
+        if self.pycord_handler is not None:
+            try:
+                await self.pycord_handler.stop()
+            except Exception as e:
+                utils.log_error(logger, e, location="stop", minimal=True)
         await self.close()
 
+    async def on_message(self, message: discord.Message):
+        # The bot uses application commands, parsing every message for prefix commands is only needed if there are any
+        if len(self.all_commands) > 0:
+            await self.process_commands(message)
+
     async def on_error(self, event_name, *args, **kwargs):
         info = sys.exc_info()
         if info and len(info) > 2 and info[0] == discord.errors.NotFound:
-            logging.warning("discord.errors.NotFound Error in %s: %s", event_name, str(info[1]))
+            logger.warning("discord.errors.NotFound Error in %s: %s", event_name, str(info[1]))
             return
         if info and len(info) > 2:
             utils.log_error(logger, info[1], location=event_name if event_name else "bot.on_error")
         else:
-            logging.exception("An unknown error occurred: %s", event_name)
+            logger.exception("An unknown error occurred: %s", event_name)
 
     def get_plugin_by_cog(self, cog: Optional[commands.Cog]):
         if cog is None:
@@ -273,16 +298,8 @@ class AccountingBot(commands.Bot):
         :param ctx:     Context
         :param err:   the error that occurred
         """
-        silent = False
         plugin = self.get_plugin_by_cog(ctx.cog)
-        for cls in SILENT_EXCEPTIONS:
-            if isinstance(err, cls):
-                silent = True
-                break
-        for cls in LOUD_EXCEPTIONS:
-            if isinstance(err, cls):
-                silent = False
-                break
+        silent = isinstance(err, SILENT_EXCEPTIONS) and not isinstance(err, LOUD_EXCEPTIONS)
         location = None
         if plugin is not None:
             location = "plugin " + plugin.name
@@ -290,49 +307,47 @@ class AccountingBot(commands.Bot):
         await send_exception(err, ctx)
 
     async def on_command_error(self, ctx: commands.Context, err: commands.CommandError):
-        silent = False
-        for cls in SILENT_EXCEPTIONS:
-            if isinstance(err, cls):
-                silent = True
-                break
-        for cls in LOUD_EXCEPTIONS:
-            if isinstance(err, cls):
-                silent = False
-                break
-        log_error(logging.getLogger(), err, minimal=silent)
+        silent = isinstance(err, SILENT_EXCEPTIONS) and not isinstance(err, LOUD_EXCEPTIONS)
+        log_error(logger, err, minimal=silent)
         await send_exception(err, ctx)
 
-    @tasks.loop(seconds=30)
-    async def log_loop(self):
-        try:
-            await self.pycord_handler.process_logs()
-        except Exception as e:
-            utils.log_error(logger, e, location="log_loop")
-
-    async def on_ready(self):
-        logger.info("Bot has logged in")
+    async def _setup_error_log(self):
+        if self.pycord_handler is None:
+            return
+        self.pycord_handler.start()
         error_log = self.config["error_log_channel"]
         if error_log is not None and error_log != -1:
             channel = await self.get_or_fetch_channel(error_log)
             if channel is None:
                 logger.error("Error log channel with id %s was not found", error_log)
+                return
             self.pycord_handler.set_channel(channel)
             logger.warning("Pycord log handler set to channel %s:%s in guild %s:%s",
                            channel.name, channel.id, channel.guild.name, channel.guild.id)
         else:
             logger.info("No error log channel defined in config")
+
+    async def on_ready(self):
+        logger.info("Bot has logged in")
+        # Both are independent of each other, the plugins have to be enabled afterward
+        if self.owner_id is None and not self.owner_ids:
+            await asyncio.gather(self._setup_error_log(), self.fetch_owner())
+        else:
+            await self._setup_error_log()
         await self.enable_plugins()
         self.state = State.online
         rp_type = self.config["rich_presence.type"]
-        if rp_type is not None:
+        if self.rich_presence is None and rp_type is not None:
             try:
-                await self.change_presence(activity=discord.Activity(
-                    type=ActivityType[self.config["rich_presence.type"]],
+                self.rich_presence = discord.Activity(
+                    type=ActivityType[rp_type],
                     name=self.config["rich_presence.name"]
-                ))
+                )
             except KeyError:
                 logger.error("Failed to set rich presence to type %s: Unknown activity type", rp_type)
                 logger.error("Allowed rich presence types are: %s", ", ".join(map(lambda a: a.name, ActivityType)))
+        if self.rich_presence is not None:
+            await self.change_presence(activity=self.rich_presence)
         logger.info("Bot is ready")
 
     async def get_or_fetch_channel(self, channel_id: int) -> Union[GuildChannel, Thread, PrivateChannel, None]:
@@ -378,20 +393,20 @@ class AccountingBot(commands.Bot):
         self.load_plugins()
         loop = self.loop
 
-        def _signal_handler(signum, frame):
-            logger.critical("Received %s, closing event loop", signal.Signals(signum).name)
-            self.shutdown_reason = f"Received signal {signal.Signals(signum).name} from operating system"
-            loop.stop()
-
-        async def _signal_handler_sync(sig: signal.Signals):
+        def _stop_loop(sig: signal.Signals):
             logger.critical("Received %s, closing event loop", sig.name)
             self.shutdown_reason = f"Received signal {sig.name} from operating system"
             loop.stop()
 
+        # noinspection PyUnusedLocal
+        def _signal_handler(signum, frame):
+            # Called outside the event loop, the loop has to be stopped thread-safe
+            loop.call_soon_threadsafe(_stop_loop, signal.Signals(signum))
+
         try:
             # Try to add signal handlers to the event loop, this may not work on all operating systems
-            loop.add_signal_handler(signal.SIGTERM, lambda: asyncio.ensure_future(_signal_handler_sync(signal.SIGTERM)))
-            loop.add_signal_handler(signal.SIGINT, lambda: asyncio.ensure_future(_signal_handler_sync(signal.SIGINT)))
+            loop.add_signal_handler(signal.SIGTERM, _stop_loop, signal.SIGTERM)
+            loop.add_signal_handler(signal.SIGINT, _stop_loop, signal.SIGINT)
         except NotImplementedError:
             # If the event loop does not support signal handlers, they will be handled directly
             signal.signal(signal.SIGTERM, _signal_handler)
@@ -470,7 +485,7 @@ class BotCommands(commands.Cog):
     @owner_only()
     async def cmd_stop(self, ctx: ApplicationContext):
         self.bot.shutdown_reason = f"Manual shutdown executed by {ctx.user.name}:{ctx.user.id}"
-        logger.critical("Shutdown Command received, shutting down bot in 10 seconds")
+        logger.critical("Shutdown Command received, shutting down bot")
         await ctx.respond("Bot wird gestoppt...")
         await self.bot.stop()
 
@@ -514,6 +529,12 @@ class BotCommands(commands.Cog):
         await ctx.response.defer(ephemeral=silent)
         logger.info("Reloading config, executed by %s:%s", ctx.user.name, ctx.user.id)
         self.bot.load_config()
+        for wrapper in self.bot.get_plugins(require_state=PluginState.LOADED, exact=False):
+            try:
+                wrapper.plugin.on_config_reload()
+            except Exception as e:
+                logger.error("Error while reloading config of plugin %s:%s", wrapper.module_name, wrapper.name)
+                utils.log_error(logger, e, location="config_reload")
         await ctx.followup.send("Config reloaded\nNot all plugins might be using the new config version.")
 
 
@@ -582,6 +603,10 @@ class BotPlugin(ABC):
         # Gets called before reloading the extension
         pass
 
+    def on_config_reload(self):
+        # Gets called after the config got reloaded by the bot, values cached by the plugin should be refreshed
+        pass
+
     # noinspection PyMethodMayBeStatic,PyUnusedLocal
     async def get_status(self, short=False) -> Dict[str, str]:
         """
@@ -828,12 +853,12 @@ def get_raw_plugin_config(plugin_name: str) -> Dict[str, str]:
         for line in file:
             if not is_config and not (len(line.lstrip()) == 0 or line.lstrip().startswith("#")):
                 break
-            if not is_config and "PluginConfig".casefold() in line.casefold():
+            if not is_config and "pluginconfig" in line.casefold():
                 is_config = True
             if not is_config:
                 continue
             trimmed = re.sub(r"^ *# *", "", line).rstrip("\n")
-            if trimmed.casefold().startswith("End".casefold()):
+            if trimmed.casefold().startswith("end"):
                 is_config = False
                 break
             if trimmed.startswith("-"):
@@ -920,10 +945,7 @@ async def build_status_embed(bot: AccountingBot) -> Embed:
               f"Loaded: {len(bot.get_plugins(PluginState.LOADED))}\n"
               f"Enabled: {len(bot.get_plugins(PluginState.ENABLED))}\n```"
     )
-    desc = ""
-    for plugin in sorted(map(lambda w: w.name, bot.get_plugins(PluginState.ENABLED))):
-        desc += plugin + ", "
-    desc = desc.rstrip(", ")
+    desc = ", ".join(sorted(map(lambda w: w.name, bot.get_plugins(PluginState.ENABLED))))
     if len(desc) == 0:
         desc = "N/A"
     embed.add_field(
@@ -2,6 +2,7 @@
 # Name: DataUtilsPlugin
 # Author: Blaumeise03
 # End
+import asyncio
 import collections
 import logging
 import math
@@ -49,6 +50,8 @@ CNFG_KILL_TREE = {
     "field_system": (str, "Location"),
     "regex_system": (str, "([-a-zA-Z0-9 ]+) < .* < .*")
 }
+KILLMAIL_KEYS = ["id", "final_blow", "ship", "kill_value", "system"]
+FINAL_BLOW_PATTERN = re.compile(r"\[[a-zA-Z0-9]+] (.*)")
 
 
 class DataUtilsPlugin(BotPlugin):
@@ -63,9 +66,13 @@ class DataUtilsPlugin(BotPlugin):
         self.config.load_tree(CONFIG_TREE)
         self.killmail_config = self.config.create_sub_config("killmail_parser")
         self.killmail_config.load_tree(CNFG_KILL_TREE)
+        self.killmail_patterns = {}  # type: Dict[str, re.Pattern]
+        self.killmail_fields = {}  # type: Dict[str, str]
         self.resource_order = {}  # type: Dict[str, int]
+        self.warmup_task = None  # type: asyncio.Task | None
 
     def on_load(self):
+        self.on_config_reload()
         self.info("Starting database connection")
         self.db = UniverseDatabase(
             username=self.config["db.username"],
@@ -86,11 +93,32 @@ class DataUtilsPlugin(BotPlugin):
                 i += 1
         self.info("Loaded resource table")
 
+    async def on_enable(self):
+        # The first rendered image starts kaleido's browser process which takes a few seconds, this is done in the
+        # background so the first user does not have to wait for it
+        self.warmup_task = asyncio.create_task(create_image(go.Figure(), format="png", width=10, height=10))
+        self.warmup_task.add_done_callback(_on_warmup_done)
+
+    def on_config_reload(self):
+        self.killmail_patterns = {
+            key: re.compile(self.killmail_config[f"regex_{key}"]) for key in KILLMAIL_KEYS
+        }
+        self.killmail_fields = {key: self.killmail_config[f"field_{key}"] for key in KILLMAIL_KEYS}
+
     def on_unload(self):
         logger.info("Closing database connection")
         self.db.engine.dispose()
 
 
+def _on_warmup_done(task: asyncio.Task):
+    if task.cancelled():
+        return
+    if task.exception() is not None:
+        logger.warning("Failed to warm up the image renderer: %s", task.exception())
+        return
+    logger.info("Image renderer is ready")
+
+
 class Item(object):
     def __init__(self, name: str, amount: Union[int, float]):
         self.name = name
@@ -567,41 +595,39 @@ def create_map_graph(inc_low_entries=False):
 
 def lowsec_pipe_analysis(graph: nx.Graph, lowsec_entries: List[str]):
     logger.info("Analysing shortest route to lowsec for %s lowsec entry systems", len(lowsec_entries))
+    entry_set = set(lowsec_entries)
     all_nodes = dict()
     for node, data in graph.nodes(data=True):
-        if node not in lowsec_entries:
+        if node not in entry_set:
             data["d_low"] = None
         else:
             data["d_low"] = 0
         data["suc"] = None
         data["sucs"] = 0
-        if data["security"] < 0 or node in lowsec_entries:
+        if data["security"] < 0 or node in entry_set:
             all_nodes[node] = data
 
     current_nodes = list(lowsec_entries)
     for system in lowsec_entries:
         all_nodes[system]["d_low"] = 0
     next_nodes = []
-    end_notes = []
+    # Used as an ordered set, removing nodes from a list would be O(n) for every node
+    end_notes = {}  # type: Dict[str, None]
     distance = 0
     while True:
         distance += 1
         logger.info("Processing %s systems with distance=%s", len(current_nodes), distance)
-        while len(current_nodes) > 0:
-            node = current_nodes.pop(0)
-            deleted = False
+        for node in current_nodes:
             for n in graph.neighbors(node):
                 if n not in all_nodes:
                     continue
                 if all_nodes[n]["d_low"] is not None:
                     continue
-                if not deleted and node in end_notes:
-                    end_notes.remove(node)
-                    deleted = True
+                end_notes.pop(node, None)
                 all_nodes[n]["suc"] = node
                 all_nodes[n]["d_low"] = distance
                 next_nodes.append(n)
-                end_notes.append(n)
+                end_notes[n] = None
 
         if len(next_nodes) == 0:
             logger.info("Processed all systems")
@@ -609,7 +635,7 @@ def lowsec_pipe_analysis(graph: nx.Graph, lowsec_entries: List[str]):
         current_nodes = next_nodes
         next_nodes = []
     logger.info("Analysing catchment area")
-    current_nodes = end_notes
+    current_nodes = list(end_notes)
     next_nodes = []
     logger.info("Found %s end systems", len(current_nodes))
 
@@ -620,16 +646,15 @@ def lowsec_pipe_analysis(graph: nx.Graph, lowsec_entries: List[str]):
             edge["routes"] += 1
             incr_path(all_nodes[c_n]["suc"])
 
-    visited = []
+    visited = set()
     while True:
-        while len(current_nodes) > 0:
-            node = current_nodes.pop(0)
+        for node in current_nodes:
             if all_nodes[node]["suc"] is None:
                 continue
             n = all_nodes[node]["suc"]
             if n not in visited:
                 next_nodes.append(n)
-                visited.append(n)
+                visited.add(n)
             incr_path(node)
         if len(next_nodes) == 0:
             logger.info("Processed all systems")
@@ -728,9 +753,9 @@ def get_item(item_name: str):
     return data_plugin.db.fetch_item(item_name)
 
 
-def extract_value(embed: Embed, field_name: str, field_regex: str):
+def extract_value(embed: Embed, field_name: str, field_regex: Union[str, re.Pattern]):
     value = None
-    if field_name.casefold() == "title".casefold():
+    if field_name.casefold() == "title":
         value = embed.title
     else:
         for field in embed.fields:
@@ -749,18 +774,18 @@ def extract_value(embed: Embed, field_name: str, field_regex: str):
 
 @wrap_async
 def save_killmail(embed: Embed, member_plugin: MembersPlugin):
-    config = data_plugin.killmail_config
-    if config["field_id"] == "":
+    fields = data_plugin.killmail_fields
+    if fields["id"] == "":
         return 0
     kill_data = {}
-    for key in ["id", "final_blow", "ship", "kill_value", "system"]:
-        kill_data[key] = extract_value(embed, config[f"field_{key}"], config[f"regex_{key}"])
+    for key in KILLMAIL_KEYS:
+        kill_data[key] = extract_value(embed, fields[key], data_plugin.killmail_patterns[key])
     if None in kill_data.values():
         logger.warning("Embed with title '%s' doesn't contains a valid killmail: %s", embed.title, kill_data)
         return 0
     data_plugin.db.save_killmail(kill_data)
-    m = re.fullmatch(r"\[[a-zA-Z0-9]+] (.*)", kill_data["final_blow"])
-    if len(m.groups()) == 0:
+    m = FINAL_BLOW_PATTERN.fullmatch(kill_data["final_blow"])
+    if m is None:
         return 1
     player, _, _ = member_plugin.find_main_name(name=m.group(1))
     if player is None:
@@ -785,7 +810,7 @@ def get_top_kills(corp_tag: str):
 
 
 def get_kill_id(embed: Embed):
-    kill_id = extract_value(embed, data_plugin.killmail_config["field_id"], data_plugin.killmail_config["regex_id"])
+    kill_id = extract_value(embed, data_plugin.killmail_fields["id"], data_plugin.killmail_patterns["id"])
     if kill_id is None or not kill_id.isnumeric():
         raise InputException(f"Embed doesn't contain a valid kill id: '{kill_id}'")
     return int(kill_id)
@@ -17,7 +17,6 @@ from typing import List, Dict, Optional, Callable, Coroutine, Any, Union, TYPE_C
 
 import aiohttp
 import discord
-import requests
 from discord import User, Embed, Color, ApplicationContext, Message, InputTextStyle, Interaction
 from discord.ui import InputText, Button
 
@@ -38,6 +37,7 @@ item_prices = {}  # type: Dict[str, Dict[str, Union[int, float]]]
 available_prices = []
 pending_resources = {}  # type: Dict[str, float]
 average_prices_url: Optional[str] = None
+prices_time_stamp = None  # type: str | None
 last_reload = datetime(1907, 1, 1)
 pi_resources = []
 pi_ids = {}  # type: Dict[str, int]
@@ -79,43 +79,48 @@ async def reload_pending_resources(project: "ProjectPlugin"):
 
 
 async def reload_prices():
+    global prices_time_stamp
+    if average_prices_url is None:
+        return
     logger.info("Reloading item prices")
-    available_prices.clear()
+    async with aiohttp.ClientSession() as session:
+        async with session.get(average_prices_url) as response:
+            csv_data = await response.text()
+    f = StringIO(csv_data)
+    reader = csv.reader(f, delimiter="\t")
+    header = next(reader, None)
+    if header is None:
+        logger.warning("Could not load average prices, header is emtpy")
+        return
+    if "average_price_no_outliers" not in header or "item_name" not in header:
+        logger.warning("Could not load average prices, invalid header: %s", header)
+        return
+    time_stamp = header[0]
+    if time_stamp == prices_time_stamp:
+        logger.info("Average prices from %s are already loaded", time_stamp)
+        return
+    index_price = header.index("average_price_no_outliers")
+    index_name = header.index("item_name")
+
+    # The old prices stay available until the new ones are parsed, the dicts are updated in place as other modules
+    # hold references to them
+    prices = {}
+    for row in reader:
+        if len(row) < max(index_price, index_name):
+            continue
+        prices[row[index_name]] = {"average_price": float(row[index_price])}
     item_prices.clear()
-    if average_prices_url is not None:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(average_prices_url) as response:
-                csv_data = await response.text()
-        f = StringIO(csv_data)
-        reader = csv.reader(f, delimiter="\t")
-        header = next(reader, None)
-        if header is None:
-            logger.warning("Could not load average prices, header is emtpy")
-            return
-        if "average_price_no_outliers" not in header or "item_name" not in header:
-            logger.warning("Could not load average prices, invalid header: %s", header)
-            return
-        time_stamp = header[0]
-        index_price = header.index("average_price_no_outliers")
-        index_name = header.index("item_name")
-
-        count = 0
-        for row in reader:
-            if len(row) < max(index_price, index_name):
-                continue
-            count += 1
-            if row[index_name] not in item_prices:
-                item_prices[row[index_name]] = {}
-            item_prices[row[index_name]]["average_price"] = float(row[index_price])
-        available_prices.append("average_price")
-        logger.info("Loaded %s average prices from %s", count, time_stamp)
+    item_prices.update(prices)
+    available_prices[:] = ["average_price"]
+    prices_time_stamp = time_stamp
+    logger.info("Loaded %s average prices from %s", len(prices), time_stamp)
 
 
 def get_price(item: str, price_types: List[str]) -> Optional[Union[float, int]]:
     if item not in item_prices or len(price_types) == 0:
         return None
     prices = item_prices[item]
-    if price_types[0].casefold() == "max".casefold():
+    if price_types[0].casefold() == "max":
         return max(prices.values())
     p = 0
     for t, v in prices.items():
@@ -952,9 +957,9 @@ class AutoSelectArrayModal(ErrorHandledModal):
         if re_debug.search(inp):
             debug_data = {}
             inp = re_debug.sub("", inp, 1)
-        if inp.strip().casefold() == "ISK".casefold():
+        if inp.strip().casefold() == "isk":
             arrays = await self.plan.auto_select()
-        elif difflib.SequenceMatcher(None, "Projekt".casefold(), inp.strip().casefold()).ratio() > 0.75:
+        elif difflib.SequenceMatcher(None, "projekt", inp.strip().casefold()).ratio() > 0.75:
             await reload_pending_resources(self.session.plugin.bot.get_plugin("ProjectPlugin"))
             weights = {k: v for k, v in pending_resources.items() if k in pi_resources}
             if len(weights) == 0:
@@ -1158,7 +1163,7 @@ class EditPlanModal(ErrorHandledModal):
                     await self.session.refresh_msg()
                     return
                 self.plan.preferred_prices.clear()
-                if in1.strip().casefold() == "max".casefold():
+                if in1.strip().casefold() == "max":
                     self.plan.preferred_prices = ["MAX"]
                     await interaction.response.send_message(
                         "Es wird nun der Bestpreis für deine Berechnungen zugrunde gelegt.", ephemeral=True)
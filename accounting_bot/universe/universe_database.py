@@ -118,19 +118,16 @@ class UniverseDatabase:
                         item_names: Optional[List[str]] = None,
                         item_type: Optional[str] = None) -> Dict[str, Dict[str, float]]:
         with Session(self.engine) as conn:
+            # All items get loaded with one query instead of one query per item
+            query = conn.query(Item).options(joinedload(Item.prices))
             if item_names is None:
                 if item_type is None:
                     raise TypeError("One argument is required")
-                stmt = select(Item.name).filter(Item.type == item_type)
-                res = conn.execute(stmt).all()
-                item_names = [r[0] for r in res]
+                query = query.filter(Item.type == item_type)
+            else:
+                query = query.filter(Item.name.in_(item_names))
             items = {}
-            for item_name in item_names:
-                db_item = (
-                    conn.query(Item)
-                    .options(joinedload(Item.prices))
-                    .filter(Item.name == item_name)
-                ).first()
+            for db_item in query.all():
                 prices = {}
                 for price in db_item.prices:
                     prices[price.price_type] = price.price_value
@@ -681,35 +678,39 @@ class UniverseDatabase:
             return
         system_cache = {}  # type: Dict[str, System]
         ship_cache = {}  # type: Dict[str, Item]
+        # Resolving the column indices once instead of searching the header for every field of every row
+        col = {}  # type: Dict[str, int]
+        for i, name in enumerate(header):
+            col.setdefault(name, i)
         with Session(self.engine) as conn:
             for row in csv_reader:
                 if len(row) < len(header):
                     continue
-                kill_id = row[header.index("id")]
+                kill_id = row[col["id"]]
                 kill_obj = conn.query(MobiKillmail).filter(MobiKillmail.id == kill_id).first()
                 if kill_obj is None:
                     kill_obj = MobiKillmail()
                     kill_obj.id = kill_id
-                kill_obj.report_id = row[header.index("report_id")] or None
-                kill_obj.is_kill = row[header.index("report_type")].casefold() == "kill".casefold()
-                kill_obj.killer_corp = _ensure_len(replace_tag or row[header.index("killer_corp")], 6)
-                kill_obj.killer_name = row[header.index("killer_name")]
-                kill_obj.victim_corp = _ensure_len(row[header.index("victim_corp")], 6)
-                kill_obj.victim_name = row[header.index("victim_name")]
-                kill_obj.isk = row[header.index("isk")]
-                kill_obj.image_url = row[header.index("image_url")]
-                kill_obj.date_killed = parser.parse(row[header.index("date_killed")])
-                kill_obj.date_updated = parser.parse(row[header.index("date_updated")])
-                kill_obj.date_created = parser.parse(row[header.index("date_created")])
-                kill_obj.external_provider = row[header.index("external_provider")]
-                kill_obj.victim_total_damage_received = row[header.index("victim_total_damage_received")] or None
-                kill_obj.user_id = row[header.index("user_id")] or None
-                kill_obj.guild_id = row[header.index("guild_id")] or None
-                kill_obj.battle_type = row[header.index("battle_type")]
+                kill_obj.report_id = row[col["report_id"]] or None
+                kill_obj.is_kill = row[col["report_type"]].casefold() == "kill"
+                kill_obj.killer_corp = _ensure_len(replace_tag or row[col["killer_corp"]], 6)
+                kill_obj.killer_name = row[col["killer_name"]]
+                kill_obj.victim_corp = _ensure_len(row[col["victim_corp"]], 6)
+                kill_obj.victim_name = row[col["victim_name"]]
+                kill_obj.isk = row[col["isk"]]
+                kill_obj.image_url = row[col["image_url"]]
+                kill_obj.date_killed = parser.parse(row[col["date_killed"]])
+                kill_obj.date_updated = parser.parse(row[col["date_updated"]])
+                kill_obj.date_created = parser.parse(row[col["date_created"]])
+                kill_obj.external_provider = row[col["external_provider"]]
+                kill_obj.victim_total_damage_received = row[col["victim_total_damage_received"]] or None
+                kill_obj.user_id = row[col["user_id"]] or None
+                kill_obj.guild_id = row[col["guild_id"]] or None
+                kill_obj.battle_type = row[col["battle_type"]]
 
-                kill_obj.killer_ship_name = row[header.index("killer_ship_type")] or None
-                kill_obj.victim_ship_name = row[header.index("victim_ship_type")] or None
-                system_name = row[header.index("system")]
+                kill_obj.killer_ship_name = row[col["killer_ship_type"]] or None
+                kill_obj.victim_ship_name = row[col["victim_ship_type"]] or None
+                system_name = row[col["system"]]
                 if system_name not in system_cache:
                     system = conn.query(System).filter(System.name == system_name).first()
                     if system is not None:
@@ -834,8 +835,9 @@ class DatabaseInitializer(UniverseDatabase):
                 session.commit()
             logger.info("Database initialized")
 
-    def auto_init_pool(self, path: str, pool_size=20):
-        pool = ThreadPool(processes=pool_size)
+    def auto_init_pool(self, path: str, pool_size=5):
+        # Every thread holds its own database connection, threads beyond the engine's pool size (default 5) open
+        # additional overflow connections which get discarded afterward
         file_length = get_file_len(path)
         # Splitting file onto thread pool
         logger.info("Found %s lines in file %s, preparing thread pool with %s threads",
@@ -850,7 +852,8 @@ class DatabaseInitializer(UniverseDatabase):
                 args.append((path, last_line + 1, last_line + lines_per_thread))
             last_line += lines_per_thread
         logger.info("Starting threadpool")
-        pool.starmap(self.init_db_from_csv, args)
+        with ThreadPool(processes=pool_size) as pool:
+            pool.starmap(self.init_db_from_csv, args)
         logger.info("Threadpool finished, database initialized")
 
     def auto_init_item_types(self, item_types: Dict[str, Tuple[int, int]]):
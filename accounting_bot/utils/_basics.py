@@ -33,8 +33,9 @@ if exists("discord_ids.json"):
         discord_users = json.load(json_file)
 
 executor = ThreadPoolExecutor(max_workers=5)
-loop = asyncio.get_event_loop()
 _T = TypeVar("_T")
+# Traceback frames of these libraries are not logged
+_LIBRARY_FRAME_PATTERN = re.compile(r" *File .*[/\\]site-packages[/\\]((discord)|(sqlalchemy)).*")
 
 cmd_annotations = {}  # type: Dict[Callable, List[CmdAnnotation]]
 
@@ -43,7 +44,7 @@ def wrap_async(func: Callable[..., _T]):
     @functools.wraps(func)
     async def run(*args, **kwargs) -> _T:
         try:
-            return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+            return await asyncio.get_running_loop().run_in_executor(executor, functools.partial(func, *args, **kwargs))
         except RuntimeError as e:
             if "cannot schedule new futures after shutdown" in str(e):
                 raise BotOfflineException(f"Can't start new executor task '{func.__name__}'") from e
@@ -181,16 +182,14 @@ def log_error(logger: logging.Logger,
               ctx: Union[ApplicationContext, Interaction, Context] = None,
               minimal: bool = False):
     location = location if type(location) == str else f"class {location.__name__}" if location else None
-    full_error = traceback.format_exception(type(error), error, error.__traceback__)
-    silent = False
     if error and is_caused_by(error, discord.errors.NotFound) and ("Unknown interaction" in str(error)):
-        logger.warning("discord.errors.NotFound Error at %s: %s", location, str(error))
-        full_error = get_minimal_traceback(full_error)
-        silent = True
-
-    if error and error.__class__ == exceptions.BotOfflineException:
-        if len(full_error) > 2:
-            full_error = [full_error[0], full_error[-2], full_error[-1]]
+        # These errors are very common (e.g. interaction timeouts) and get ignored anyway, formatting the full
+        # traceback would only cause unnecessary file IO
+        logger.warning("%s Error at %s: %s", error.__class__.__name__, location, error)
+        return
+    if minimal and not logger.isEnabledFor(logging.INFO):
+        # Ignored errors are only logged with level INFO, there is no need to build the message
+        return
 
     if ctx is not None:
         if location is not None:
@@ -208,20 +207,21 @@ def log_error(logger: logging.Logger,
         logger.info("Ignored error: %s", get_cause_chain(error, ", "))
         return
 
-    if not silent:
-        logger.error(err_msg)
-    regexp = re.compile(r" *File .*[/\\]site-packages[/\\]((discord)|(sqlalchemy)).*")
+    # The traceback is only formatted if it actually gets logged
+    full_error = traceback.format_exception(type(error), error, error.__traceback__)
+    if error and error.__class__ == exceptions.BotOfflineException:
+        if len(full_error) > 2:
+            full_error = [full_error[0], full_error[-2], full_error[-1]]
+
+    logger.error(err_msg)
     skipped = 0
     for line in full_error:
-        if regexp.search(line):
+        if _LIBRARY_FRAME_PATTERN.search(line):
             skipped += 1
             continue
         for line2 in line.split("\n"):
             if len(line2.strip()) > 0:
-                if not silent:
-                    logger.exception(line2, exc_info=False)
-                else:
-                    logger.warning(line2)
+                logger.exception(line2, exc_info=False)
     if skipped > 0:
         logger.warning("Skipped %s traceback frames", skipped)
 
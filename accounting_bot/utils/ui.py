@@ -1,47 +1,84 @@
 import asyncio
-import functools
-from typing import Optional, Dict, Coroutine, Callable, Union, List, Self
+from typing import Optional, Dict, Coroutine, Callable, Union, List, Self, Set, TYPE_CHECKING
 
 import discord
-from discord import InteractionResponse, Interaction, InputTextStyle, Button, ApplicationContext, Embed, Webhook
+from discord import InteractionResponse, Interaction, InputTextStyle, User, Member
 from discord.ui import InputText
 
 from accounting_bot.exceptions import InputException
 from accounting_bot.utils import ErrorHandledModal, AutoDisableView
 
+if TYPE_CHECKING:
+    from discord import Button, Embed, Webhook, Message
+
 
 class FormTimeoutException(InputException):
     pass
 
 
+async def _remove_message(ctx: Interaction, message: Optional["Message"]):
+    """
+    Responds to the interaction and removes the message of the view. Ephemeral messages only get their view removed,
+    this requires only one request as it also completes the interaction, instead of deferring and deleting it.
+
+    :param ctx: The interaction which has not been responded to yet
+    :param message: The message of the view
+    """
+    if message is not None and message.flags.ephemeral:
+        await ctx.response.edit_message(view=None)
+        return
+    await ctx.response.defer(invisible=True)
+    if message is not None:
+        await message.delete()
+
+
 class ModalForm(ErrorHandledModal):
-    def __init__(self, title: str, send_response: Union[str, bool, None] = None, ignore_timeout=False, *args, **kwargs):
+    # Every open form keeps a pending timeout, forms that never get submitted are dropped after this time to bound the
+    # number of waiting forms and their timers
+    TIMEOUT = 15 * 60
+    # Value for send_response, defers the response visibly (thinking...), so the result can be sent as followup later
+    DEFER_VISIBLE = "defer_visible"
+    # The forms that are currently waiting for a submission, by user id. Only one form per user is kept open.
+    _open_forms = {}  # type: Dict[int, ModalForm]
+
+    def __init__(self,
+                 title: str,
+                 send_response: Union[str, bool, None] = None,
+                 ignore_timeout=False,
+                 timeout: Optional[float] = TIMEOUT,
+                 *args, **kwargs):
         """
 
         :param title: The title for the form
         :param send_response: The response message after submitting. If None the interaction will not be completed and
                                can be retrieved by get_interaction for custom responses. If true the response will get
-                               deferred. If a string is given, it will get send to the user.
+                               deferred. If a string is given, it will get send to the user. If DEFER_VISIBLE is
+                               given, the response will get deferred visibly, the result can be sent via the followup.
+        :param timeout: The timeout in seconds, None if the caller enforces its own deadline
         :param args:
         :param kwargs:
         """
-        super().__init__(title=title, timeout=30 * 60, *args, **kwargs)
+        super().__init__(title=title, timeout=timeout, *args, **kwargs)
         self.ignore_timeout = ignore_timeout
         self._is_timeout = False
         self.submit_message = send_response
         self._interaction = None  # type: Interaction | None
         self._results = None  # type: Dict[str, str] | None
+        self._labels = []  # type: List[str]
+        self._first_value = None  # type: str | None
 
     async def callback(self, interaction: Interaction):
         self._interaction = interaction
-        self._results = {}
-        for item in self.children:
-            self._results[item.label] = item.value
+        self._results = {label: item.value for label, item in zip(self._labels, self.children)}
+        self._first_value = self.children[0].value if len(self.children) > 0 else None
         if self.submit_message is None or self.submit_message is False:
             return
         if self.submit_message is True:
             await interaction.response.defer(ephemeral=True, invisible=True)
             return
+        if self.submit_message == ModalForm.DEFER_VISIBLE:
+            await interaction.response.defer(ephemeral=True, invisible=False)
+            return
         await interaction.response.send_message(self.submit_message, ephemeral=True)
 
     def add_field(self,
@@ -52,6 +89,7 @@ class ModalForm(ErrorHandledModal):
                   max_length: int | None = None,
                   required: bool | None = True,
                   value: str | None = None):
+        self._labels.append(label)
         self.add_item(InputText(label=label,
                                 style=style,
                                 placeholder=placeholder,
@@ -61,9 +99,29 @@ class ModalForm(ErrorHandledModal):
                                 value=value))
         return self
 
-    async def open_form(self, response: InteractionResponse):
+    async def open_form(self, response: InteractionResponse, user: Union[User, Member, None] = None):
+        """
+        Sends the form and waits for the submission. If a user is given, only one form per user is kept open, an
+        older form of the same user gets stopped and its caller receives a timeout.
+
+        :param response: The response of the interaction that opens the form
+        :param user: The user that opens the form
+        :return: This form
+        :raise FormTimeoutException: If the form was not submitted and ignore_timeout is not set
+        """
         await response.send_modal(self)
-        await self.wait()
+        user_id = user.id if user is not None else None
+        if user_id is not None:
+            previous = ModalForm._open_forms.get(user_id, None)
+            if previous is not None:
+                # The user opened a new form, the old one will be treated as timed out
+                previous.stop()
+            ModalForm._open_forms[user_id] = self
+        try:
+            await self.wait()
+        finally:
+            if user_id is not None and ModalForm._open_forms.get(user_id, None) is self:
+                del ModalForm._open_forms[user_id]
         if self._results is None:
             self._is_timeout = True
             if not self.ignore_timeout:
@@ -81,11 +139,11 @@ class ModalForm(ErrorHandledModal):
         if label is None and index is None:
             if len(self._results) > 1:
                 raise TypeError("Both label and index are None and there is more than one result")
-            return next(iter(self._results.values()))
+            return self._first_value
         elif label is not None:
             return self._results[label]
         elif index is not None:
-            return self._results[self.children[index].label]
+            return self._results[self._labels[index]]
 
     def retrieve_results(self, ignore_timeout=False):
         if self._results is None and not ignore_timeout:
@@ -111,14 +169,13 @@ class ConfirmView(AutoDisableView):
         self.function = callback
 
     @discord.ui.button(label="Bestätigen", style=discord.ButtonStyle.green)
-    async def btn_confirm(self, button: Button, ctx: Interaction):
+    async def btn_confirm(self, button: "Button", ctx: Interaction):
         await self.function(ctx)
         await self.message.delete()
 
     @discord.ui.button(label="Abbrechen", style=discord.ButtonStyle.grey)
-    async def btn_abort(self, button: Button, ctx: Interaction):
-        await ctx.response.defer(invisible=True)
-        await self.message.delete()
+    async def btn_abort(self, button: "Button", ctx: Interaction):
+        await _remove_message(ctx, self.message)
 
 
 class AwaitConfirmView(AutoDisableView):
@@ -129,10 +186,10 @@ class AwaitConfirmView(AutoDisableView):
         self._defer_response = defer_response
 
     async def send_view(self,
-                        response: Union[InteractionResponse, Webhook],
+                        response: Union[InteractionResponse, "Webhook"],
                         message: str, ephemeral=True,
-                        embed: Embed | None = None,
-                        embeds: List[Embed] | None = None) -> Self:
+                        embed: Optional["Embed"] = None,
+                        embeds: Optional[List["Embed"]] = None) -> Self:
         if isinstance(response, InteractionResponse):
             await response.send_message(
                 content=message,
@@ -157,32 +214,38 @@ class AwaitConfirmView(AutoDisableView):
             return
         await self.interaction.response.defer(ephemeral=True, invisible=True)
 
+    async def _close(self):
+        if self._defer_response:
+            await _remove_message(self.interaction, self.message)
+        else:
+            await self.message.delete()
+        self.stop()
+
     @discord.ui.button(label="Bestätigen", style=discord.ButtonStyle.green)
-    async def btn_confirm(self, button: Button, ctx: Interaction):
+    async def btn_confirm(self, button: "Button", ctx: Interaction):
         self.confirmed = True
         self.interaction = ctx
-        if self._defer_response:
-            await self.defer_response()
-        await self.message.delete()
-        self.stop()
+        await self._close()
 
     @discord.ui.button(label="Abbrechen", style=discord.ButtonStyle.grey)
-    async def btn_abort(self, button: Button, ctx: Interaction):
+    async def btn_abort(self, button: "Button", ctx: Interaction):
         self.confirmed = False
         self.interaction = ctx
-        if self._defer_response:
-            await self.defer_response()
-        await self.message.delete()
-        self.stop()
+        await self._close()
 
 
 class NumPadView(AutoDisableView):
+    # Holds references to pending background tasks, otherwise they might get garbage collected before completion
+    _background_tasks = set()  # type: Set[asyncio.Task]
+    # The number buttons with their row offset, in the same layout as a numpad
+    _NUMBERS = [(n, row) for row, numbers in enumerate(((7, 8, 9), (4, 5, 6), (1, 2, 3))) for n in numbers]
+
     class NumberButton(discord.ui.Button):
         def __init__(self,
                      number: int,
                      callback: Callable[[int, Interaction], Coroutine],
                      *args, **kwargs):
-            super().__init__(label=f"{number}",
+            super().__init__(label=str(number),
                              style=discord.ButtonStyle.blurple,
                              *args, **kwargs)
             self.number = number
@@ -197,25 +260,21 @@ class NumPadView(AutoDisableView):
         self.consume_response = consume_response
         self.response = None  # type: InteractionResponse | None
         self.followup = None  # type: Webhook | None
-        for i in range(7, 10):
-            self.add_item(NumPadView.NumberButton(i, self.callback, row=start_row))
-        for i in range(4, 7):
-            self.add_item(NumPadView.NumberButton(i, self.callback, row=start_row + 1))
-        for i in range(1, 4):
-            self.add_item(NumPadView.NumberButton(i, self.callback, row=start_row + 2))
+        for number, row in NumPadView._NUMBERS:
+            self.add_item(NumPadView.NumberButton(number, self.callback, row=start_row + row))
         btn_custom = discord.ui.Button(
             label="...",
             style=discord.ButtonStyle.green,
             row=start_row + 3
         )
-        btn_custom.callback = functools.partial(NumPadView.btn_custom, view=self)
+        btn_custom.callback = self.btn_custom
         self.add_item(btn_custom)
         btn_cancel = discord.ui.Button(
             label="✖",
             style=discord.ButtonStyle.red,
             row=start_row + 3
         )
-        btn_cancel.callback = functools.partial(NumPadView.btn_cancel, view=self)
+        btn_cancel.callback = self.btn_cancel
         self.add_item(btn_cancel)
 
     async def callback(self, number: int, ctx: Interaction):
@@ -224,37 +283,41 @@ class NumPadView(AutoDisableView):
         self.followup = ctx.followup
         self.stop()
         if self.consume_response:
-            await ctx.response.defer(invisible=True)
-            await self.message.delete()
+            await _remove_message(ctx, self.message)
         else:
-            asyncio.get_event_loop().create_task(self.message.delete())
-
-    async def on_timeout(self) -> None:
-        await super().on_timeout()
-
-    @staticmethod
-    async def btn_custom(ctx: Interaction, view):
-        # noinspection PyTypeChecker
-        modal = await (
-            ModalForm(title="Insert Number", send_response=None, ignore_timeout=True)
-            .add_field(label="Insert Number", placeholder="Insert Number here")
-            .open_form(ctx.response)
-        )
-        if modal.is_timeout():
-            return
+            task = asyncio.create_task(self.message.delete())
+            NumPadView._background_tasks.add(task)
+            task.add_done_callback(NumPadView._background_tasks.discard)
+
+    async def btn_custom(self, ctx: Interaction):
+        # The modal and the view don't get their own timeouts, the deadline below covers the whole chain
+        modal = ModalForm(title="Insert Number", send_response=None, ignore_timeout=True, timeout=None)
+        confirm = AwaitConfirmView(defer_response=False, timeout=None)
         try:
-            number = int(modal.retrieve_result())
-        except ValueError as e:
-            await modal.get_response().send_message(f"Input is not a valid number: {e}", ephemeral=True)
+            async with asyncio.timeout(30 * 60):
+                # noinspection PyTypeChecker
+                await (
+                    modal
+                    .add_field(label="Insert Number", placeholder="Insert Number here")
+                    .open_form(ctx.response, ctx.user)
+                )
+                if modal.is_timeout():
+                    return
+                try:
+                    number = int(modal.retrieve_result())
+                except ValueError as e:
+                    await modal.get_response().send_message(f"Input is not a valid number: {e}", ephemeral=True)
+                    return
+                await confirm.send_view(modal.get_response(), message=f"Please confirm the number `{number}`")
+        except TimeoutError:
+            modal.stop()
+            confirm.stop()
+            await confirm.on_timeout()
             return
-        confirm = await (AwaitConfirmView(defer_response=False)
-                         .send_view(modal.get_response(), message=f"Please confirm the number `{number}`"))
         if not confirm.confirmed:
             await confirm.defer_response()
             return
-        await view.callback(number, confirm.interaction)
+        await self.callback(number, confirm.interaction)
 
-    @staticmethod
-    async def btn_cancel(ctx: ApplicationContext, view):
-        await ctx.response.defer(invisible=True)
-        await view.message.delete()
+    async def btn_cancel(self, ctx: Interaction):
+        await _remove_message(ctx, self.message)
@@ -1,66 +1,122 @@
 import asyncio
 import logging
 import os
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 
 import discord
 from dotenv import load_dotenv
 
-from accounting_bot.discordLogger import PycordHandler
+from accounting_bot.discordLogger import PycordHandler, CachedTimeFormatter
 from accounting_bot.main_bot import AccountingBot
 from accounting_bot.universe import pi_planer
 
-logger = logging.getLogger()
-log_filename = "logs/" + datetime.now().strftime("%Y-%m-%d_%H-%M-%S") + ".log"
-print("Logging outputs goes to: " + log_filename)
-if not os.path.exists("logs/"):
-    os.mkdir("logs")
-formatter = logging.Formatter(fmt="[%(asctime)s][%(levelname)s][%(name)s]: %(message)s")
+logger = logging.getLogger("bot")
 
-# File log handler
-file_handler = logging.FileHandler(log_filename, encoding="utf-8")
-file_handler.setLevel(logging.INFO)
-file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
-# Console log handler
-console = logging.StreamHandler(sys.stdout)
-console.setLevel(logging.DEBUG)
-console.setFormatter(formatter)
-logger.addHandler(console)
-# Discord channel log handler
-discord_handler = PycordHandler(level=logging.WARNING)
-discord_handler.setFormatter(formatter)
-logger.addHandler(discord_handler)
-# Root logger
-logger.setLevel(logging.INFO)
-# interaction_logger = logging.getLogger("bot.access") ToDo: Add interaction logger
 
+def setup_logging() -> tuple[PycordHandler, QueueListener]:
+    # Thread and process information are not part of the log format, no need to collect them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    root_logger = logging.getLogger()
+    log_filename = f"logs/{datetime.now():%Y-%m-%d_%H-%M-%S}.log"
+    print("Logging outputs goes to: " + log_filename)
+    os.makedirs("logs", exist_ok=True)
+    formatter = CachedTimeFormatter(fmt="[%(asctime)s][%(levelname)s][%(name)s]: %(message)s")
 
-loop = asyncio.get_event_loop()
+    # File log handler
+    file_handler = logging.FileHandler(log_filename, encoding="utf-8")
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(formatter)
+    # Console log handler
+    console = logging.StreamHandler(sys.stdout)
+    console.setLevel(logging.DEBUG)
+    console.setFormatter(formatter)
+    # The file and console output is handled by a background thread to avoid blocking IO inside the event loop
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    queue_listener = QueueListener(log_queue, file_handler, console, respect_handler_level=True)
+    queue_listener.start()
+    # Discord channel log handler
+    discord_handler = PycordHandler(level=logging.WARNING)
+    discord_handler.setFormatter(formatter)
+    # Warnings of third party libraries are only written into the log file, not sent into the discord channel
+    discord_handler.addFilter(
+        lambda record: (record.levelno >= logging.ERROR or
+                        record.name.split(".", 1)[0] in ("bot", "ext", "accounting_bot"))
+    )
+    root_logger.addHandler(discord_handler)
+    # Root logger
+    root_logger.setLevel(logging.INFO)
+    # interaction_logger = logging.getLogger("bot.access") ToDo: Add interaction logger
+    return discord_handler, queue_listener
 
-# loading env
-logging.info("Loading .env for discord token and config path")
-load_dotenv()
-TOKEN = os.getenv('DISCORD_TOKEN')
-CNFG_PATH = os.getenv("BOT_CONFIG", "config.json")
-pi_planer.average_prices_url = os.getenv("AVERAGE_PRICES_URL", None)
 
-# Setting up discord intents
-intents = discord.Intents.default()
-# noinspection PyUnresolvedReferences,PyDunderSlots
-intents.message_content = True
-# noinspection PyUnresolvedReferences,PyDunderSlots
-intents.reactions = True
-# noinspection PyUnresolvedReferences,PyDunderSlots
-intents.members = True
+def create_intents() -> discord.Intents:
+    intents = discord.Intents.default()
+    # noinspection PyUnresolvedReferences,PyDunderSlots
+    intents.message_content = True
+    # noinspection PyUnresolvedReferences,PyDunderSlots
+    intents.reactions = True
+    # noinspection PyUnresolvedReferences,PyDunderSlots
+    intents.members = True
+    # Disabling events the bot doesn't use, these would only get decoded and cached
+    # noinspection PyUnresolvedReferences,PyDunderSlots
+    intents.typing = False
+    # noinspection PyUnresolvedReferences,PyDunderSlots
+    intents.integrations = False
+    # noinspection PyUnresolvedReferences,PyDunderSlots
+    intents.webhooks = False
+    # noinspection PyUnresolvedReferences,PyDunderSlots
+    intents.invites = False
+    # noinspection PyUnresolvedReferences,PyDunderSlots
+    intents.voice_states = False
+    # noinspection PyUnresolvedReferences,PyDunderSlots
+    intents.scheduled_events = False
+    return intents
 
-bot = AccountingBot(
-    intents=intents,
-    help_command=None,
-    config_path=CNFG_PATH,
-    pycord_handler=discord_handler,
-    # debug_guilds=[582649395149799491, 758444788449148938]
-)
 
-bot.run(TOKEN)
+def main():
+    discord_handler, queue_listener = setup_logging()
+    try:
+        # uvloop is optional, it has to be installed before the event loop gets created
+        import uvloop
+        uvloop.install()
+        logger.info("Using uvloop event loop policy")
+    except ImportError:
+        pass
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    if hasattr(asyncio, "eager_task_factory"):
+        # Python 3.12+: Tasks run eagerly until they suspend, cached lookups complete without being scheduled
+        loop.set_task_factory(asyncio.eager_task_factory)
+
+    # loading env
+    logger.info("Loading .env for discord token and config path")
+    load_dotenv()
+    token = os.getenv('DISCORD_TOKEN')
+    config_path = os.getenv("BOT_CONFIG", "config.json")
+    pi_planer.average_prices_url = os.getenv("AVERAGE_PRICES_URL", None)
+
+    bot = AccountingBot(
+        intents=create_intents(),
+        help_command=None,
+        config_path=config_path,
+        loop=loop,
+        pycord_handler=discord_handler,
+        # The message cache is not used, reactions are handled by the raw events
+        max_messages=None,
+        # debug_guilds=[582649395149799491, 758444788449148938]
+    )
+
+    try:
+        bot.run(token)
+    finally:
+        queue_listener.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -87,6 +87,6 @@ class TestCommands(commands.Cog):
             ModalForm(title="Test", send_response="Abgeschickt")
             .add_field(label="A")
             .add_field(label="B")
-            .open_form(ctx.response)
+            .open_form(ctx.response, ctx.user)
         )
         await ctx.followup.send(str(res), ephemeral=True)
@@ -0,0 +1,71 @@
+import unittest
+
+from discord import ComponentType
+from discord.ui.view import ViewStore
+
+from accounting_bot.config import Config
+from tests.utils import run_async
+
+try:
+    from accounting_bot.ext import accounting
+except ModuleNotFoundError:
+    # The mariadb connector is not available
+    accounting = None
+
+MENU_ID = 1001
+TRANSACTION_ID = 1002
+
+
+class FakeBot:
+    def __init__(self):
+        self.config = Config()
+        self.view_store = ViewStore(None)
+
+    def create_sub_config(self, root_key: str) -> Config:
+        return self.config.create_sub_config(root_key)
+
+    def add_view(self, view, message_id=None):
+        self.view_store.add_view(view, message_id)
+
+
+def routed_view(store: ViewStore, message_id: int, custom_id: str):
+    # Same lookup as ViewStore.dispatch
+    # noinspection PyProtectedMember
+    value = (store._views.get((ComponentType.button.value, message_id, custom_id)) or
+             store._views.get((ComponentType.button.value, None, custom_id)))
+    return value[0] if value is not None else None
+
+
+@unittest.skipIf(accounting is None, "mariadb is not installed")
+class AccountingReloadTest(unittest.TestCase):
+    @staticmethod
+    def create_plugin(bot: FakeBot) -> "accounting.AccountingPlugin":
+        # Registers the views like on_enable does
+        plugin = accounting.AccountingPlugin(bot, None)
+        plugin.menu_view = accounting.AccountingView(plugin)
+        bot.add_view(plugin.menu_view)
+        plugin.transaction_view = accounting.TransactionView(plugin)
+        bot.add_view(plugin.transaction_view)
+        return plugin
+
+    @run_async
+    async def test_reload_routes_to_new_plugin(self):
+        bot = FakeBot()
+        old = self.create_plugin(bot)
+        # Messages sent while the plugin is enabled (e.g. by /setup) get registered for their message id
+        bot.add_view(old.menu_view, MENU_ID)
+        bot.add_view(old.transaction_view, TRANSACTION_ID)
+        self.assertIs(old, routed_view(bot.view_store, MENU_ID, "accounting:transfer").plugin)
+
+        await old.on_disable()
+        self.assertIsNone(old.menu_view)
+        self.assertIsNone(old.transaction_view)
+        # The menu message is up-to-date and doesn't get edited by the new plugin
+        new = self.create_plugin(bot)
+        for custom_id in accounting.AccountingView.CUSTOM_IDS:
+            self.assertIs(new, routed_view(bot.view_store, MENU_ID, custom_id).plugin)
+        self.assertIs(new, routed_view(bot.view_store, TRANSACTION_ID, "transaction:verify").plugin)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,6 @@
+import asyncio
+import glob
+import json
 import os
 import unittest
 
@@ -63,6 +66,100 @@ class ConfigTest(unittest.TestCase):
         self.assertEqual(0.5, config_b["keyC.keyC3"])
         self.assertListEqual(["DefB", "DefBB"], config_b["keyB"])
 
+    def test_save_after_reload(self):
+        config = Config()
+        config.load_tree({"keyA": (str, "DefA")})
+        config.save_config(CFG_PATH)
+        # The file gets edited by hand and reloaded
+        with open(CFG_PATH, "w", encoding="utf8") as file:
+            json.dump({"keyA": "Edited"}, file)
+        config.load_config(CFG_PATH)
+        self.assertEqual("Edited", config["keyA"])
+        # Back to the last saved state, the file still contains the edited value and has to be written
+        config["keyA"] = "DefA"
+        config.save_config(CFG_PATH)
+        with open(CFG_PATH, encoding="utf8") as file:
+            self.assertEqual({"keyA": "DefA"}, json.load(file))
+
+    def test_save_deleted_file(self):
+        config = Config()
+        config.load_tree({"keyA": (str, "DefA")})
+        config.save_config(CFG_PATH)
+        os.remove(CFG_PATH)
+        config.save_config(CFG_PATH)
+        with open(CFG_PATH, encoding="utf8") as file:
+            self.assertEqual({"keyA": "DefA"}, json.load(file))
+
+    def test_load_json(self):
+        config = Config()
+        config.load_tree({
+            "keyA": (str, "DefA"),
+            "keyB": {
+                "keyB1": (int, 42)
+            }
+        })
+        config.load_json('{"keyA": "ValA", "keyB": {"keyB1": 7}}')
+        self.assertEqual("ValA", config["keyA"])
+        self.assertEqual(7, config["keyB.keyB1"])
+
+    def test_save_async(self):
+        config_a = Config()
+        config_a.load_tree({
+            "keyA": (str, "DefA"),
+            "keyB": (list, ["DefB"])
+        })
+        config_a["keyA"] = "ValA"
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(config_a.save_config_async(CFG_PATH))
+        loop.close()
+        config_b = Config()
+        config_b.load_tree({
+            "keyA": (str, "DefA2"),
+            "keyB": (list, [])
+        })
+        config_b.load_config(CFG_PATH)
+        self.assertEqual("ValA", config_b["keyA"])
+        self.assertListEqual(["DefB"], config_b["keyB"])
+
+    def test_save_unchanged(self):
+        config = Config()
+        config.load_tree({
+            "keyA": (str, "DefA")
+        })
+        config.save_config(CFG_PATH)
+        self.assertListEqual([], glob.glob(CFG_PATH + ".*.tmp"))
+        # The config did not change, it should not be written again
+        with open(CFG_PATH, "w", encoding="utf8") as file:
+            file.write("{}")
+        config.save_config(CFG_PATH)
+        with open(CFG_PATH, encoding="utf8") as file:
+            self.assertEqual({}, json.load(file))
+        config["keyA"] = "ValA"
+        config.save_config(CFG_PATH)
+        with open(CFG_PATH, encoding="utf8") as file:
+            self.assertEqual({"keyA": "ValA"}, json.load(file))
+
+    def test_save_async_concurrent(self):
+        config = Config()
+        config.load_tree({
+            "keyA": (str, "DefA")
+        })
+
+        async def _save(value: str):
+            config["keyA"] = value
+            await config.save_config_async(CFG_PATH)
+
+        async def _save_all():
+            await asyncio.gather(*[_save(f"Val{i}") for i in range(10)])
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(_save_all())
+        loop.close()
+        # The file must contain valid json with the latest state, no temporary files may be left behind
+        with open(CFG_PATH, encoding="utf8") as file:
+            self.assertDictEqual({"keyA": "Val9"}, json.load(file))
+        self.assertListEqual([], glob.glob(CFG_PATH + ".*.tmp"))
+
 
 if __name__ == '__main__':
     unittest.main()
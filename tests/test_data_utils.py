@@ -0,0 +1,46 @@
+import unittest
+
+import networkx as nx
+
+from accounting_bot.universe.data_utils import lowsec_pipe_analysis
+
+SECURITY = {
+    "E1": 0.5, "E2": 0.4, "H1": 0.9, "H2": 0.7,
+    "A": -0.1, "B": -0.2, "C": -0.3, "D": -0.4, "F": -0.5, "G": -0.6, "J": -0.7, "K": -0.8, "X": -0.9
+}
+EDGES = [
+    ("H1", "E1"), ("H1", "H2"), ("H2", "E2"), ("E1", "E2"), ("E1", "A"), ("A", "B"), ("B", "C"), ("A", "D"),
+    ("D", "C"), ("E2", "F"), ("F", "G"), ("G", "C"), ("G", "J"), ("J", "K"), ("D", "K"), ("H2", "X")
+]
+
+
+def create_graph() -> nx.Graph:
+    graph = nx.Graph()
+    for name, security in SECURITY.items():
+        graph.add_node(name, security=security)
+    for origin, dest in EDGES:
+        graph.add_edge(origin, dest, routes=0)
+    return graph
+
+
+class LowsecPipeAnalysisTest(unittest.TestCase):
+    def test_analysis(self):
+        # The expected values were recorded with the implementation before the removal of the list operations
+        graph = create_graph()
+        lowsec_pipe_analysis(graph, ["E1", "E2"])
+        nodes = {node: (data["d_low"], data["suc"], data["sucs"]) for node, data in graph.nodes(data=True)}
+        self.assertEqual({
+            "E1": (0, None, 5), "E2": (0, None, 3), "H1": (None, None, 0), "H2": (None, None, 0),
+            "A": (1, "E1", 5), "B": (2, "A", 2), "C": (3, "B", 1), "D": (2, "A", 2), "F": (1, "E2", 3),
+            "G": (2, "F", 2), "J": (3, "G", 1), "K": (3, "D", 1), "X": (None, None, 0)
+        }, nodes)
+        routes = {frozenset((origin, dest)): data["routes"] for origin, dest, data in graph.edges(data=True)}
+        self.assertEqual({
+            frozenset(("E1", "A")): 5, frozenset(("E2", "F")): 3, frozenset(("A", "B")): 2,
+            frozenset(("A", "D")): 2, frozenset(("B", "C")): 1, frozenset(("D", "K")): 1,
+            frozenset(("F", "G")): 2, frozenset(("G", "J")): 1
+        }, {edge: count for edge, count in routes.items() if count > 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import unittest
+from logging import LogRecord
+
+from accounting_bot.discordLogger import PycordHandler
+from tests.utils import run_async
+
+
+class FakeChannel:
+    def __init__(self, fail_at=None, on_send=None):
+        self.messages = []
+        self.calls = 0
+        self.fail_at = fail_at
+        self.on_send = on_send
+
+    async def send(self, content):
+        if self.on_send is not None:
+            self.on_send()
+        self.calls += 1
+        if self.fail_at is not None and self.calls - 1 == self.fail_at:
+            raise ConnectionError("Send failed")
+        self.messages.append(content)
+
+
+def create_record(msg: str, name="bot.test") -> LogRecord:
+    return LogRecord(name, logging.WARNING, __file__, 0, msg, None, None)
+
+
+def unwrap(message: str):
+    # Removes the code block around the message
+    return message[len("```\n"):-len("\n```")].split("\n")
+
+
+class PycordHandlerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.handler = PycordHandler()
+        self.handler.setFormatter(logging.Formatter("%(message)s"))
+
+    @run_async
+    async def test_chunking(self):
+        self.handler.set_channel(FakeChannel())
+        records = [create_record(str(i) * 900) for i in range(5)]
+        for record in records:
+            self.handler.emit(record)
+        await self.handler.process_logs()
+        messages = self.handler.channel.messages
+        self.assertEqual([["0" * 900, "1" * 900], ["2" * 900, "3" * 900], ["4" * 900]], list(map(unwrap, messages)))
+        for msg in messages:
+            self.assertLessEqual(len(msg), 2000)
+        self.assertEqual([], self.handler.cache)
+
+    @run_async
+    async def test_truncate(self):
+        self.handler.set_channel(FakeChannel())
+        self.handler.emit(create_record("short"))
+        self.handler.emit(create_record("a" * 3000))
+        await self.handler.process_logs()
+        messages = self.handler.channel.messages
+        self.assertEqual([["short"], ["a" * 1970 + " **(Truncated)**"]], list(map(unwrap, messages)))
+        self.assertLessEqual(len(messages[1]), 2000)
+
+    @run_async
+    async def test_send_failure(self):
+        records = [create_record(str(i) * 900) for i in range(5)]
+        new_record = create_record("new")
+
+        def emit_new():
+            if new_record not in self.handler.cache:
+                self.handler.emit(new_record)
+
+        # The second message fails, a new record gets emitted while the messages are being sent
+        channel = FakeChannel(fail_at=1, on_send=emit_new)
+        self.handler.set_channel(channel)
+        for record in records:
+            self.handler.emit(record)
+        with self.assertRaises(ConnectionError):
+            await self.handler.process_logs()
+        self.assertEqual([["0" * 900, "1" * 900]], list(map(unwrap, channel.messages)))
+        # The unsent records are placed in front of the newer ones
+        self.assertEqual(records[2:] + [new_record], self.handler.cache)
+
+        channel = FakeChannel()
+        self.handler.set_channel(channel)
+        await self.handler.process_logs()
+        self.assertEqual([["2" * 900, "3" * 900], ["4" * 900, "new"]], list(map(unwrap, channel.messages)))
+        self.assertEqual([], self.handler.cache)
+
+    @run_async
+    async def test_retry_after_failure(self):
+        self.handler.BATCH_DELAY = 0
+        self.handler.ERROR_DELAY = 0
+        channel = FakeChannel(fail_at=0)
+        self.handler.set_channel(channel)
+        self.handler.emit(create_record("warning"))
+        self.handler.start()
+        try:
+            # No new records get emitted, the background task has to retry on its own
+            async with asyncio.timeout(1):
+                while len(channel.messages) == 0:
+                    await asyncio.sleep(0.01)
+        finally:
+            await self.handler.stop()
+        self.assertEqual(2, channel.calls)
+        self.assertEqual([["warning"]], list(map(unwrap, channel.messages)))
+        self.assertEqual([], self.handler.cache)
+
+    @run_async
+    async def test_ignore_own_records(self):
+        self.handler.emit(create_record("Failed to send logs", name="bot.logger"))
+        self.assertEqual([], self.handler.cache)
+        self.handler.emit(create_record("Other error", name="bot.logger_other"))
+        self.assertEqual(1, len(self.handler.cache))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from accounting_bot.utils.ui import ModalForm, FormTimeoutException
+from tests.utils import run_async
+
+
+class FakeResponse:
+    def __init__(self):
+        self.modals = []
+
+    async def send_modal(self, modal):
+        self.modals.append(modal)
+
+
+class ModalFormTest(unittest.TestCase):
+    @run_async
+    async def test_second_form_stops_first(self):
+        user = SimpleNamespace(id=42)
+        first = ModalForm(title="First").add_field(label="A")
+        second = ModalForm(title="Second", ignore_timeout=True).add_field(label="A")
+        first_task = asyncio.create_task(first.open_form(FakeResponse(), user))
+        await asyncio.sleep(0)
+        self.assertIs(first, ModalForm._open_forms[user.id])
+        second_task = asyncio.create_task(second.open_form(FakeResponse(), user))
+        await asyncio.sleep(0)
+        # The first form got stopped without a submission, its caller receives a timeout
+        with self.assertRaises(FormTimeoutException):
+            await asyncio.wait_for(first_task, 1)
+        self.assertTrue(first.is_timeout())
+        self.assertIs(second, ModalForm._open_forms[user.id])
+        self.assertFalse(second_task.done())
+        second.stop()
+        await asyncio.wait_for(second_task, 1)
+        self.assertTrue(second.is_timeout())
+        self.assertNotIn(user.id, ModalForm._open_forms)
+
+    @run_async
+    async def test_forms_of_different_users(self):
+        form_a = ModalForm(title="A", ignore_timeout=True).add_field(label="A")
+        form_b = ModalForm(title="B", ignore_timeout=True).add_field(label="A")
+        task_a = asyncio.create_task(form_a.open_form(FakeResponse(), SimpleNamespace(id=1)))
+        task_b = asyncio.create_task(form_b.open_form(FakeResponse(), SimpleNamespace(id=2)))
+        await asyncio.sleep(0)
+        self.assertFalse(task_a.done())
+        self.assertFalse(task_b.done())
+        form_a.stop()
+        form_b.stop()
+        await asyncio.wait_for(asyncio.gather(task_a, task_b), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
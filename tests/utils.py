@@ -0,0 +1,15 @@
+import asyncio
+
+
+def run_async(func):
+    """
+    Decorator for async test methods of a :class:`unittest.TestCase`. The test runs on a new event loop, unlike
+    :class:`unittest.IsolatedAsyncioTestCase` the current loop of the thread doesn't get replaced.
+    """
+    def wrapper(self):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(func(self))
+        finally:
+            loop.close()
+    return wrapper